@@ -1,6 +1,7 @@
 import os
 import sys
-from src.ntfs.volume import NTFSVolume
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.ntfs.volume import NTFSVolume, name_matcher, WRITE_BUFFER_SIZE
 from src.core.errors import NTFSError
 
 def print_file_list(files, indent=""):
@@ -76,32 +77,39 @@ def main():
                 print(f"Error listing files: {list_result.message}")
                 return
                 
-            for file in list_result.value:
-                if not file.is_directory and not file.name.startswith("$"):
-                    out_path = os.path.join(output_dir, file.name)
-                    print(f"\nExtracting: {file.name}")
+            # Files are independent, extract them concurrently and report
+            # from this thread so output does not interleave
+            errors = []
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {}
+                for file in list_result.value:
+                    if not file.is_directory and not file.name.startswith("$"):
+                        out_path = os.path.join(output_dir, file.name)
+                        future = executor.submit(volume.extract_file, file.name, out_path)
+                        futures[future] = (file, out_path)
+
+                for future in as_completed(futures):
+                    file, out_path = futures[future]
+                    result = future.result()
+                    if result.is_err():
+                        errors.append((file.name, result.message))
+                        continue
+                    print(f"\nExtracted: {file.name}")
                     print(f"To: {os.path.abspath(out_path)}")
                     print(f"Size: {file.size} bytes")
-                    
-                    result = volume.extract_file(file.name, out_path)
-                    if result.is_err():
-                        print(f"  Error: {result.message}")
-                    else:
-                        print(f"  Success -> {os.path.abspath(out_path)}")
-                        print(f"  Written: {os.path.getsize(out_path)} bytes")
+                    print(f"  Written: {os.path.getsize(out_path)} bytes")
+
+            for name, message in errors:
+                print(f"\nError extracting {name}: {message}")
 
         elif command == "search" and len(sys.argv) == 4:
             pattern = sys.argv[3].lower()
-            list_result = volume.list_files()
-            if list_result.is_err():
-                print(f"Error listing files: {list_result.message}")
-                return
-                
             print(f"\nFiles matching '{pattern}':")
-            for file in list_result.value:
-                if pattern in file.name.lower():
+            matches = name_matcher(pattern)
+            for path, file in volume.iter_all_files():
+                if matches(file):
                     size_str = "<DIR>" if file.is_directory else f"{file.size} bytes"
-                    print(f"{file.name} {size_str}")
+                    print(f"{path} {size_str}")
 
         elif command == "deleted":
             result = volume.list_deleted_files()
@@ -143,7 +151,7 @@ def main():
                             continue
                             
                         data = data_result.value
-                        with open(out_path, 'wb') as f:
+                        with open(out_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
                             f.write(data)
                             
                         print(f"  Success -> {os.path.abspath(out_path)}")
@@ -3,20 +3,20 @@ class NTFSVolume:
 
     def is_file_deleted(self, mft_entry) -> bool:
         """Check if a file is deleted"""
-        return not (mft_entry.flags & 0x1)  # Check if FILE_RECORD_SEGMENT_IN_USE flag is not set
+        return not mft_entry.in_use
     
     def get_file_created_time(self, mft_entry) -> int:
         """Get file creation timestamp"""
-        for attr in mft_entry.attributes:
-            if attr.type_code == STANDARD_INFORMATION:
-                return attr.created_time
+        attr = mft_entry.attributes_by_type.get(STANDARD_INFORMATION, (None,))[0]
+        if attr is not None:
+            return attr.created_time
         return 0
     
     def get_file_size(self, mft_entry) -> int:
         """Get file size"""
-        for attr in mft_entry.attributes:
-            if attr.type_code == DATA:
-                return attr.length if attr.is_resident else attr.data_size
+        attr = mft_entry.attributes_by_type.get(DATA, (None,))[0]
+        if attr is not None:
+            return attr.length if attr.is_resident else attr.data_size
         return 0
 
     def list_directory(self, path: str) -> Result[List[FileEntry]]:
@@ -35,7 +35,7 @@ class NTFSVolume:
                         name=idx_entry.filename,
                         size=self.get_file_size(file_entry),
                         created_time=self.get_file_created_time(file_entry),
-                        is_directory=bool(file_entry.flags & 0x2),  # Directory flag
+                        is_directory=file_entry.is_dir,
                         is_deleted=self.is_file_deleted(file_entry)
                     ))
             return Result.ok(entries)
@@ -1,39 +1,79 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional
 from .errors import Result, NTFSError
 
-@dataclass
+# Returned on every failed acquire, no need to build a new one each time
+_NO_BUFFERS = Result.err(NTFSError.IO_ERROR, "No buffers available")
+
+# Rented buffers larger than this are not kept for reuse
+MAX_POOLED_RENT_SIZE = 64 * 1024 * 1024
+
+@dataclass(slots=True)
 class Buffer:
-    data: bytearray
+    data: memoryview
     offset: int
     size: int
+    index: int = -1  # Slot in the owning pool
 
 class BufferPool:
     def __init__(self, buffer_size: int = 4096, max_buffers: int = 10):
         self.buffer_size = buffer_size
         self.max_buffers = max_buffers
-        self.free_buffers = []
-        self.used_buffers = set()
+        # One allocation backs every buffer; each Buffer is a view into it
+        self._slab = bytearray(buffer_size * max_buffers)
+        slab_view = memoryview(self._slab)
+        self._buffers: List[Buffer] = [
+            Buffer(data=slab_view[i * buffer_size:(i + 1) * buffer_size],
+                   offset=0, size=buffer_size, index=i)
+            for i in range(max_buffers)
+        ]
+        self._in_use: List[bool] = [False] * max_buffers
+        # Stack of free slots; lowest index is handed out first
+        self._free_indices: List[int] = list(range(max_buffers - 1, -1, -1))
+        # Returned variable-size buffers, keyed by power-of-two capacity
+        self._rented: Dict[int, List[bytearray]] = {}
+
+    @property
+    def in_use_count(self) -> int:
+        return self.max_buffers - len(self._free_indices)
 
     def acquire(self) -> Result[Buffer]:
-        if self.free_buffers:
-            buf = self.free_buffers.pop()
-            self.used_buffers.add(buf)
-            return Result.ok(buf)
-        
-        if len(self.used_buffers) >= self.max_buffers:
-            return Result.err(NTFSError.IO_ERROR, 
-                            "No buffers available")
-
-        new_buf = Buffer(
-            data=bytearray(self.buffer_size),
-            offset=0,
-            size=self.buffer_size
-        )
-        self.used_buffers.add(new_buf)
-        return Result.ok(new_buf)
+        try:
+            index = self._free_indices.pop()
+        except IndexError:
+            return _NO_BUFFERS
+
+        self._in_use[index] = True
+        buf = self._buffers[index]
+        buf.offset = 0
+        return Result.ok(buf)
 
     def release(self, buffer: Buffer) -> None:
-        if buffer in self.used_buffers:
-            self.used_buffers.remove(buffer)
-            self.free_buffers.append(buffer)
+        index = buffer.index
+        if (0 <= index < self.max_buffers and self._in_use[index]
+                and self._buffers[index] is buffer):
+            self._in_use[index] = False
+            self._free_indices.append(index)
+
+    def rent(self, size: int) -> bytearray:
+        """Get a bytearray of at least size bytes, reusing a returned one if possible
+
+        The contents are not cleared. Hand it back with return_() once done.
+        """
+        capacity = max(self.buffer_size, 1 << max(size - 1, 0).bit_length())
+        free = self._rented.get(capacity)
+        if free:
+            try:
+                return free.pop()
+            except IndexError:
+                pass  # Taken by another thread
+        return bytearray(capacity)
+
+    def return_(self, buf: bytearray) -> None:
+        """Give back a buffer from rent(), keeping up to max_buffers of each size"""
+        capacity = len(buf)
+        if capacity > MAX_POOLED_RENT_SIZE or capacity & (capacity - 1):
+            return  # Too large to hold on to, or not from rent()
+        free = self._rented.setdefault(capacity, [])
+        if len(free) < self.max_buffers:
+            free.append(buf)
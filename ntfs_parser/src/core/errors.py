@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Optional, TypeVar, Generic
+from typing import Optional, TypeVar
 
 T = TypeVar('T')
 
@@ -12,7 +12,9 @@ class NTFSError(Enum):
     INVALID_MFT = -5
     NOT_FOUND = -6
 
-class Result(Generic[T]):
+class Result:
+    __slots__ = ('value', 'error', 'message')
+
     def __init__(self, value: Optional[T] = None, 
                  error: Optional[NTFSError] = None, 
                  message: str = ""):
@@ -20,8 +22,14 @@ class Result(Generic[T]):
         self.error = error
         self.message = message
 
+    def __class_getitem__(cls, item):
+        # Keep Result[T] annotations working without typing.Generic overhead
+        return cls
+
     @staticmethod
     def ok(value: T) -> 'Result[T]':
+        if value is None:
+            return _OK_NONE
         return Result(value=value)
 
     @staticmethod
@@ -33,3 +41,6 @@ class Result(Generic[T]):
 
     def is_err(self) -> bool:
         return self.error is not None
+
+# Shared result for the many operations that succeed without a value
+_OK_NONE = Result(value=None)
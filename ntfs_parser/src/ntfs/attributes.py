@@ -2,6 +2,13 @@ from dataclasses import dataclass
 from typing import Optional
 import struct
 
+# Resident attribute header: type, length, non-resident flag, name length,
+# name offset, flags, attribute ID, content size, content offset
+_ATTR_HDR = struct.Struct('<IIBBHHHIH2x')
+
+# $FILE_NAME content: parent reference, file name length, namespace
+_FILE_NAME_HDR = struct.Struct('<Q34xBB')
+
 @dataclass
 class NTFSAttribute:
     type_id: int
@@ -12,63 +19,27 @@ class NTFSAttribute:
 def create_standard_information_attr() -> bytes:
     """Create $STANDARD_INFORMATION attribute"""
     attr = bytearray(96)  # Total size including header
-    
-    # Type (0x10)
-    struct.pack_into('<I', attr, 0, 0x10)
-    # Length
-    struct.pack_into('<I', attr, 4, 96)
-    # Non-resident flag (0 = resident)
-    attr[8] = 0
-    # Name length
-    attr[9] = 0
-    # Offset to name
-    struct.pack_into('<H', attr, 10, 0)
-    # Flags
-    struct.pack_into('<H', attr, 12, 0)
-    # Attribute ID
-    struct.pack_into('<H', attr, 14, 0)
-    # Content size
-    struct.pack_into('<I', attr, 16, 48)
-    # Content offset
-    struct.pack_into('<H', attr, 20, 24)
-    
+
+    # Type (0x10), length, resident, no name, content size 48 at offset 24
+    attr[:_ATTR_HDR.size] = _ATTR_HDR.pack(0x10, 96, 0, 0, 0, 0, 0, 48, 24)
+
     return attr
 
 def create_file_name_attr(name: str, parent_ref: int = 5) -> bytes:
     """Create $FILE_NAME attribute"""
     name_bytes = name.encode('utf-16le')
     total_size = 88 + len(name_bytes)  # Header + fixed part + name
-    
+
     attr = bytearray(total_size)
-    
-    # Type (0x30)
-    struct.pack_into('<I', attr, 0, 0x30)
-    # Length
-    struct.pack_into('<I', attr, 4, total_size)
-    # Non-resident flag
-    attr[8] = 0
-    # Name length
-    attr[9] = 0
-    # Offset to name
-    struct.pack_into('<H', attr, 10, 0)
-    # Flags
-    struct.pack_into('<H', attr, 12, 0)
-    # Attribute ID
-    struct.pack_into('<H', attr, 14, 0)
-    # Content size
-    struct.pack_into('<I', attr, 16, total_size - 24)
-    # Content offset
-    struct.pack_into('<H', attr, 20, 24)
-    
-    # Parent directory reference
-    struct.pack_into('<Q', attr, 24, parent_ref)
-    
-    # File name length
-    attr[66] = len(name)
-    # Namespace
-    attr[67] = 1  # WIN32
-    
+
+    # Type (0x30), length, resident, no name, content at offset 24
+    attr[:_ATTR_HDR.size] = _ATTR_HDR.pack(0x30, total_size, 0, 0, 0, 0, 0,
+                                           total_size - 24, 24)
+
+    # Parent directory reference, file name length, namespace (WIN32)
+    attr[24:24 + _FILE_NAME_HDR.size] = _FILE_NAME_HDR.pack(parent_ref, len(name), 1)
+
     # File name
     attr[68:68 + len(name_bytes)] = name_bytes
-    
-    return attr 
\ No newline at end of file
+
+    return attr
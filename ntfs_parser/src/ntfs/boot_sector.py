@@ -3,6 +3,11 @@ from typing import Optional
 import struct
 from ..core.errors import Result, NTFSError
 
+# Boot sector fields at their on-disk offsets: bytes per sector (0x0B),
+# sectors per cluster (0x0D), total sectors (0x28), MFT LCN (0x30),
+# MFT record size (0x40), index record size (0x44), serial number (0x48)
+_BOOT_SECTOR = struct.Struct('<11xHB26xQQ8xB3xB3x8s')
+
 @dataclass
 class NTFSBootSector:
     bytes_per_sector: int
@@ -30,13 +35,8 @@ class NTFSBootSector:
                 )
 
             # Parse boot sector fields
-            bps = struct.unpack_from('<H', data, 0x0B)[0]
-            spc = data[0x0D]
-            mft_lcn = struct.unpack_from('<Q', data, 0x30)[0]
-            mft_rec_size = data[0x40]
-            idx_rec_size = data[0x44]
-            serial = data[0x48:0x50]
-            total_sectors = struct.unpack_from('<Q', data, 0x28)[0]
+            (bps, spc, total_sectors, mft_lcn, mft_rec_size,
+             idx_rec_size, serial) = _BOOT_SECTOR.unpack_from(data, 0)
 
             return Result.ok(cls(
                 bytes_per_sector=bps,
@@ -1,14 +1,72 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 from datetime import datetime
 from ..core.errors import Result, NTFSError
-import traceback
+import logging
+import struct
+
+logger = logging.getLogger(__name__)
+
+# FILE record header: signature, sequence number, first attribute offset,
+# flags, used size, allocated size, base record reference
+_MFT_ENTRY_HDR = struct.Struct('<4s12xH2xHHIIQ')
+
+# Just the signature and flags of a FILE record header
+_MFT_ENTRY_FLAGS = struct.Struct('<4s18xH')
+
+# Attribute type alone, to spot the end-of-attributes marker
+_ATTR_TYPE = struct.Struct('<I')
+_ATTR_END = 0xFFFFFFFF
+
+# Attribute header: type, length, non-resident flag, name length, name offset,
+# then (resident only) content size and content offset
+_ATTR_HDR = struct.Struct('<IIBBH4xIH')
+
+# Non-resident attribute header: data runs offset (0x20), data size (0x30)
+_NONRESIDENT_HDR = struct.Struct('<H14xQ')
+
+# Attribute contents up to this size are read through a pooled buffer and
+# copied out; larger ones get their own buffer, returned without a copy
+POOLED_READ_SIZE = 1024 * 1024
 
 @dataclass
 class DataRun:
-    cluster: int  # Starting cluster number
+    cluster: Optional[int]  # Starting cluster number, None for a sparse run
     length: int   # Number of clusters
 
+def _decode_data_runs(data: bytes, offset: int) -> List[DataRun]:
+    """Decode a mapping pairs array into absolute cluster runs
+
+    Sparse runs, which have no cluster offset, become runs without a
+    cluster; they read as zeros.
+    """
+    runs: List[DataRun] = []
+    end = len(data)
+    lcn = 0  # Logical cluster number
+
+    while offset < end:
+        header = data[offset]
+        if header == 0:
+            break
+
+        length_size = header & 0x0F
+        offset_size = header >> 4
+        start = offset + 1
+        offset = start + length_size + offset_size
+        if offset > end:
+            logger.debug("Data run would exceed buffer: %d > %d", offset, end)
+            break
+
+        # Run length, then signed cluster offset relative to the previous run
+        length = int.from_bytes(data[start:start + length_size], 'little')
+        if offset_size == 0:
+            runs.append(DataRun(cluster=None, length=length))  # Sparse, lcn unchanged
+            continue
+        lcn += int.from_bytes(data[start + length_size:offset], 'little', signed=True)
+        runs.append(DataRun(cluster=lcn, length=length))
+
+    return runs
+
 @dataclass
 class MFTAttribute:
     type_id: int
@@ -22,8 +80,8 @@ class MFTAttribute:
     def from_raw_data(cls, attr_type: int, name: Optional[str], resident: bool, 
                       data: bytes, offset: int = 0) -> 'MFTAttribute':
         """Create attribute from raw data"""
-        print(f"Creating attribute: type=0x{attr_type:x}, resident={resident}, data_len={len(data)}")
-        print(f"First 32 bytes: {data[:32].hex()}")
+        logger.debug("Creating attribute: type=0x%x, resident=%s, data_len=%d",
+                     attr_type, resident, len(data))
         
         attr = cls(
             type_id=attr_type,
@@ -39,60 +97,76 @@ class MFTAttribute:
             try:
                 # For non-resident attributes, the header is at the start of the data
                 # Get data runs offset from the start of the attribute
-                runs_offset = int.from_bytes(data[32:34], 'little')  # Offset is at 0x20
-                data_size = int.from_bytes(data[48:56], 'little')   # Size is at 0x30
+                runs_offset, data_size = _NONRESIDENT_HDR.unpack_from(data, 32)
                 
-                print(f"Non-resident attribute: size={data_size}, runs_offset={runs_offset}")
-                print(f"Data at runs offset: {data[runs_offset:runs_offset+16].hex()}")
+                logger.debug("Non-resident attribute: size=%d, runs_offset=%d",
+                             data_size, runs_offset)
                 
                 # Parse data runs
-                current_offset = runs_offset
-                current_lcn = 0  # Logical cluster number
-                
-                while current_offset < len(data):
-                    header = data[current_offset]
-                    if header == 0:
-                        break
-                        
-                    length_size = header & 0x0F
-                    offset_size = (header >> 4) & 0x0F
-                    current_offset += 1
-                    
-                    print(f"Data run at {current_offset-1}: header=0x{header:02x}, length_size={length_size}, offset_size={offset_size}")
-                    
-                    if current_offset + length_size + offset_size > len(data):
-                        print(f"Data run would exceed buffer: {current_offset + length_size + offset_size} > {len(data)}")
-                        break
-                    
-                    # Read run length
-                    length_bytes = data[current_offset:current_offset+length_size]
-                    length = int.from_bytes(length_bytes, 'little')
-                    current_offset += length_size
-                    
-                    # Read cluster offset (can be negative)
-                    lcn_bytes = data[current_offset:current_offset+offset_size]
-                    if lcn_bytes[-1] & 0x80:  # Negative number
-                        lcn_offset = int.from_bytes(lcn_bytes, 'little', signed=True)
-                    else:
-                        lcn_offset = int.from_bytes(lcn_bytes, 'little')
-                    current_offset += offset_size
-                    
-                    current_lcn += lcn_offset
-                    print(f"Found data run: cluster={current_lcn}, length={length}")
-                    print(f"Length bytes: {length_bytes.hex()}, LCN bytes: {lcn_bytes.hex()}")
-                    
-                    attr.data_runs.append(DataRun(cluster=current_lcn, length=length))
-                
+                attr.data_runs = cls._coalesce_runs(_decode_data_runs(data, runs_offset))
                 attr.data_size = data_size
-                print(f"Parsed {len(attr.data_runs)} data runs")
+                logger.debug("Parsed %d data runs", len(attr.data_runs))
                 
             except Exception as e:
-                print(f"Error parsing data runs: {str(e)}")
-                print(f"Stack trace:")
-                traceback.print_exc()
+                logger.error("Error parsing data runs: %r", e)
+                logger.debug("Stack trace:", exc_info=True)
         
         return attr
 
+    @staticmethod
+    def _coalesce_runs(runs: List[DataRun]) -> List[DataRun]:
+        """Merge data runs that are physically contiguous on disk, and adjacent sparse runs"""
+        merged: List[DataRun] = []
+        for run in runs:
+            if merged and (merged[-1].cluster is None) == (run.cluster is None) and (
+                    run.cluster is None or merged[-1].cluster + merged[-1].length == run.cluster):
+                merged[-1].length += run.length
+            else:
+                merged.append(run)
+        return merged
+
+    def read_all(self, volume, skip_errors: bool = False) -> Result[bytes]:
+        """Read attribute contents with a single read per data run
+
+        Runs are read straight into one buffer sized from the data runs.
+        Contents over POOLED_READ_SIZE come back as that bytearray, without
+        a final copy. Sparse runs read as zeros. With skip_errors, runs that
+        cannot be read are left out instead of failing the read.
+        """
+        if self.resident:
+            return Result.ok(self.data)
+
+        # Let the OS fetch every run at once before reading them in order
+        volume.prefetch_runs(self.data_runs)
+        total = sum(run.length for run in self.data_runs) << volume._cluster_shift
+        pooled = total <= POOLED_READ_SIZE
+        buf = volume.buffer_pool.rent(total) if pooled else bytearray(total)
+        try:
+            with memoryview(buf) as view:
+                pos = 0
+                for run in self.data_runs:
+                    if run.cluster is None:
+                        hole = min(run.length << volume._cluster_shift, total - pos)
+                        if pooled:  # A rented buffer still holds earlier contents
+                            view[pos:pos + hole] = bytes(hole)
+                        pos += hole
+                        continue
+                    read_result = volume.readinto_clusters(run.cluster, run.length, view[pos:])
+                    if read_result.is_err():
+                        if skip_errors:
+                            continue
+                        return read_result
+                    pos += read_result.value
+
+                size = min(pos, self.data_size)
+                if pooled:
+                    return Result.ok(bytes(view[:size]))
+            del buf[size:]  # Only once the view is released
+            return Result.ok(buf)
+        finally:
+            if pooled:
+                volume.buffer_pool.return_(buf)
+
 @dataclass
 class MFTEntry:
     reference: int
@@ -102,9 +176,19 @@ class MFTEntry:
     used_size: int
     allocated_size: int
     attributes: List[MFTAttribute]
+    attributes_by_type: Dict[int, List[MFTAttribute]] = field(default_factory=dict)
+    # Header flag bits and $FILE_NAME presence, computed once when parsed
+    in_use: bool = False
+    is_dir: bool = False
+    has_filename: bool = False
 
     @classmethod
     def from_bytes(cls, data: bytes, offset: int = 0) -> Result['MFTEntry']:
+        """Parse an MFT entry from bytes or a buffer such as a memoryview
+
+        Anything kept from the record is copied out, so the caller may reuse
+        the buffer once this returns.
+        """
         try:
             # Verify "FILE" signature
             if data[offset:offset+4] != b'FILE':
@@ -114,41 +198,34 @@ class MFTEntry:
                 )
 
             # Parse MFT entry header
-            sequence = int.from_bytes(data[offset+16:offset+18], 'little')
-            flags = int.from_bytes(data[offset+22:offset+24], 'little')
-            used_size = int.from_bytes(data[offset+24:offset+28], 'little')
-            alloc_size = int.from_bytes(data[offset+28:offset+32], 'little')
-            base_ref = int.from_bytes(data[offset+32:offset+40], 'little')
+            (_, sequence, first_attr, flags, used_size,
+             alloc_size, base_ref) = _MFT_ENTRY_HDR.unpack_from(data, offset)
 
             # Parse attributes
             attrs: List[MFTAttribute] = []
-            attr_offset = offset + int.from_bytes(data[offset+20:offset+22], 'little')
+            attrs_by_type: Dict[int, List[MFTAttribute]] = {}
+            attr_offset = offset + first_attr
 
             while attr_offset < offset + used_size:
-                attr_type = int.from_bytes(data[attr_offset:attr_offset+4], 'little')
-                if attr_type == 0xFFFFFFFF:
+                if _ATTR_TYPE.unpack_from(data, attr_offset)[0] == _ATTR_END:
                     break
 
-                attr_len = int.from_bytes(data[attr_offset+4:attr_offset+8], 'little')
-                resident_flag = data[attr_offset+8]
-                name_len = data[attr_offset+9]
-                name_offset = attr_offset + int.from_bytes(data[attr_offset+10:attr_offset+12], 'little')
+                (attr_type, attr_len, resident_flag, name_len, name_offset,
+                 content_size, content_offset) = _ATTR_HDR.unpack_from(data, attr_offset)
+                name_offset += attr_offset
 
                 # Get attribute name if present
                 name = None
                 if name_len > 0:
-                    name = data[name_offset:name_offset+name_len*2].decode('utf-16-le')
+                    name = str(data[name_offset:name_offset+name_len*2], 'utf-16-le')
 
                 # Get attribute data
                 if resident_flag == 0:  # Resident
-                    content_size = int.from_bytes(data[attr_offset+16:attr_offset+20], 'little')
-                    content_offset = attr_offset + int.from_bytes(data[attr_offset+20:attr_offset+22], 'little')
-                    attr_data = data[content_offset:content_offset+content_size]
+                    content_offset += attr_offset
+                    attr_data = bytes(data[content_offset:content_offset+content_size])
                 else:  # Non-resident
                     # For non-resident, include the entire attribute record
-                    attr_data = data[attr_offset:attr_offset+attr_len]
-
-                print(f"Attribute 0x{attr_type:02x}: resident={resident_flag==0}, length={attr_len}")
+                    attr_data = bytes(data[attr_offset:attr_offset+attr_len])
 
                 # Create attribute with data runs parsing
                 attr = MFTAttribute.from_raw_data(
@@ -158,6 +235,7 @@ class MFTEntry:
                     data=attr_data
                 )
                 attrs.append(attr)
+                attrs_by_type.setdefault(attr_type, []).append(attr)
 
                 attr_offset += attr_len
 
@@ -168,7 +246,11 @@ class MFTEntry:
                 flags=flags,
                 used_size=used_size,
                 allocated_size=alloc_size,
-                attributes=attrs
+                attributes=attrs,
+                attributes_by_type=attrs_by_type,
+                in_use=bool(flags & 0x0001),
+                is_dir=bool(flags & 0x0002),
+                has_filename=0x30 in attrs_by_type  # $FILE_NAME
             ))
 
         except Exception as e:
@@ -177,19 +259,17 @@ class MFTEntry:
                 f"Failed to parse MFT entry: {str(e)}"
             )
 
-    def is_in_use(self) -> bool:
-        return bool(self.flags & 0x0001)
-
-    def is_directory(self) -> bool:
-        return bool(self.flags & 0x0002)
-
-    def has_file_name(self) -> bool:
-        """Check if entry has a filename attribute"""
-        for attr in self.attributes:
-            if attr.type_id == 0x30:  # $FILE_NAME
-                return True
-        return False
+    def get_attribute(self, type_id: int, name: Optional[str] = None) -> Optional[MFTAttribute]:
+        """Get the first attribute of a type with the given name, by default the unnamed one"""
+        for attr in self.attributes_by_type.get(type_id, ()):
+            if (attr.name or None) == name:
+                return attr
+        return None
 
-    def is_in_use(self) -> bool:
-        """Check if the entry is in use"""
-        return bool(self.flags & 0x01)
+    @staticmethod
+    def peek_flags(data: bytes, offset: int = 0) -> Optional[int]:
+        """Read only the header flags of a raw MFT entry, None if not a FILE record"""
+        signature, flags = _MFT_ENTRY_FLAGS.unpack_from(data, offset)
+        if signature != b'FILE':
+            return None
+        return flags
@@ -1,18 +1,56 @@
-from typing import List, Optional, BinaryIO
+from typing import Dict, Iterator, List, Optional, BinaryIO, Set, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+import bisect
+import mmap
 import os
+import re
+import threading
 import binascii
-import traceback
+import logging
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_DEPTH = 32  # Chunks of read-ahead kept in flight during scans
+MAX_OPEN_FILES = 32  # Split files kept mapped at once
+DIRECT_IO_ALIGN = 4096  # Offset and length alignment for O_DIRECT reads
+
+# Known signatures reported by check_ftk_format, matched in a single pass.
+# The lookahead makes matches zero-width so overlapping hits are all found.
+HEADER_SIGNATURES = (b'FTK', b'NTFS', b'FILE', b'MFT')
+_HEADER_SIGNATURES_RE = re.compile(b'(?=(' + b'|'.join(HEADER_SIGNATURES) + b'))')
+
+# Sectors starting with an NTFS boot sector or a FILE record. Anchored with
+# match(), the lazy 512-byte skip only tries the signature at sector starts,
+# and group 1 marks the start of the matching sector.
+_BOOT_SECTOR_RE = re.compile(b'(?:.{512})*?().{3}NTFS', re.DOTALL)
+_FILE_RECORD_SECTOR_RE = re.compile(b'(?:.{512})*?()FILE', re.DOTALL)
 
 class SplitImageFile:
-    """Handles reading from split NTFS image files"""
-    def __init__(self, base_path: str):
+    """Handles reading from split NTFS image files
+
+    With direct_io, split files are read with O_DIRECT where the OS and file
+    system allow it, bypassing the page cache; meant for one-pass scans of
+    images too large to be worth caching.
+    """
+    def __init__(self, base_path: str, direct_io: bool = False):
         self.base_path = base_path
-        self.files = []
-        self.current_file = None
-        self.current_offset = 0
+        self.direct_io = direct_io and hasattr(os, 'O_DIRECT') and hasattr(os, 'preadv')
+        self.paths: List[str] = []
+        self.file_sizes: List[int] = []
+        self._cum_offsets: List[int] = [0]  # Image offset where each file starts
+        # Split files are opened on first use. Mapped files are kept in LRU
+        # order and dropped past MAX_OPEN_FILES; files that cannot be mapped
+        # stay open, as another thread may be reading from their descriptor.
+        self._maps: 'OrderedDict[int, mmap.mmap]' = OrderedDict()
+        self._unmapped: Dict[int, BinaryIO] = {}
+        self._direct: Set[int] = set()  # Files among _unmapped opened with O_DIRECT
+        self._sequential = True
+        self._lock = threading.Lock()  # Guards the open files, and seek+read where pread is missing
         
     def open(self) -> bool:
-        """Open all split image files"""
+        """Find all split image files, opening only the first"""
         try:
             print("Looking for split files in: ")
             print(f"Base name: {self.base_path}")
@@ -23,8 +61,7 @@ class SplitImageFile:
             if not os.path.exists(filename):
                 print(f"Primary image file not found: {filename}")
                 return False
-            
-            self.files.append(open(filename, 'rb'))
+            self.paths.append(filename)
             
             # Look for additional split files (optional)
             i = 2
@@ -33,81 +70,294 @@ class SplitImageFile:
                 print(f"Checking for optional file: {filename}")
                 if not os.path.exists(filename):
                     break
-                self.files.append(open(filename, 'rb'))
+                self.paths.append(filename)
                 i += 1
             
-            print(f"Found {len(self.files)} split image files")
-            self.current_file = self.files[0]
+            print(f"Found {len(self.paths)} split image files")
+            self.file_sizes = [os.path.getsize(path) for path in self.paths]
+            self._cum_offsets = list(accumulate(self.file_sizes, initial=0))
+            self._handle(0)  # Fail here if the image cannot be opened
             return True
             
         except Exception as e:
             print(f"Error opening split files: {str(e)}")
             return False
+
+    def _handle(self, file_index: int) -> Tuple[Optional[mmap.mmap], Optional[BinaryIO]]:
+        """Get (mapping, None) for a split file, or (None, file) if it cannot be
+        mapped, opening it on first use"""
+        with self._lock:
+            mm = self._maps.get(file_index)
+            if mm is not None:
+                self._maps.move_to_end(file_index)
+                return mm, None
+            f = self._unmapped.get(file_index)
+            if f is not None:
+                return None, f
+
+            if self.direct_io:
+                f = self._open_direct(self.paths[file_index])
+                if f is not None:
+                    self._direct.add(file_index)
+                    self._unmapped[file_index] = f
+                    return None, f
+
+            # Unbuffered: reads go through mmap or pread, so a Python-level
+            # read buffer would only add a copy
+            f = open(self.paths[file_index], 'rb', buffering=0)
+            mm = self._map(f)
+            self._advise_file(f, mm, self._sequential)
+            if mm is None:
+                self._unmapped[file_index] = f
+                return None, f
+
+            # The mapping holds its own descriptor. Evicted mappings are not
+            # closed here; they are unmapped once no reader still holds them.
+            f.close()
+            self._maps[file_index] = mm
+            while len(self._maps) > MAX_OPEN_FILES:
+                self._maps.popitem(last=False)
+            return mm, None
             
+    @staticmethod
+    def _open_direct(path: str) -> Optional[BinaryIO]:
+        """Open a split file with O_DIRECT, None if the file system does not support it"""
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+        except OSError:
+            return None
+        return os.fdopen(fd, 'rb', buffering=0)
+
+    @staticmethod
+    def _read_direct(f: BinaryIO, file_offset: int, size: int) -> bytes:
+        """Read from an O_DIRECT file through an aligned buffer covering the range"""
+        start = file_offset - file_offset % DIRECT_IO_ALIGN
+        end = -(-(file_offset + size) // DIRECT_IO_ALIGN) * DIRECT_IO_ALIGN
+        with mmap.mmap(-1, end - start) as buf:  # Anonymous maps are page aligned
+            read = os.preadv(f.fileno(), [buf], start)
+            return buf[file_offset - start:min(read, file_offset + size - start)]
+
+    @staticmethod
+    def _map(f: BinaryIO) -> Optional[mmap.mmap]:
+        """Memory-map a split file read-only"""
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return None  # Empty or unmappable file, fall back to read()
+
+    def _locate(self, offset: int) -> Optional[Tuple[int, int]]:
+        """Map an image offset to (file index, offset within that file)"""
+        file_index = bisect.bisect_right(self._cum_offsets, offset) - 1
+        if file_index < 0 or file_index >= len(self.paths):
+            return None
+        return file_index, offset - self._cum_offsets[file_index]
+
+    def _segments(self, file_index: int, file_offset: int, size: int) -> Iterator[Tuple[int, int, int]]:
+        """Split a read starting in one file into (file index, file offset, length)
+        pieces, one per split file it touches"""
+        file_sizes = self.file_sizes
+        while size > 0 and file_index < len(file_sizes):
+            length = min(size, file_sizes[file_index] - file_offset)
+            if length > 0:
+                yield file_index, file_offset, length
+                size -= length
+            file_index += 1
+            file_offset = 0
+
+    def _read_file(self, file_index: int, file_offset: int, size: int) -> bytes:
+        """Read from a single split file"""
+        mm, f = self._handle(file_index)
+        if mm is not None:
+            return mm[file_offset:file_offset + size]
+        if file_index in self._direct:
+            return self._read_direct(f, file_offset, size)
+        if hasattr(os, 'pread'):
+            # One positioned read, no shared file position to lock
+            return os.pread(f.fileno(), size, file_offset)
+        with self._lock:
+            f.seek(file_offset)
+            return f.read(size)
+
+    def _readinto_file(self, file_index: int, file_offset: int, buf: memoryview) -> int:
+        """Read from a single split file into buf"""
+        mm, f = self._handle(file_index)
+        if mm is not None:
+            n = max(0, min(len(buf), len(mm) - file_offset))
+            with memoryview(mm) as view:
+                buf[:n] = view[file_offset:file_offset + n]
+            return n
+        if file_index in self._direct:
+            data = self._read_direct(f, file_offset, len(buf))
+            buf[:len(data)] = data
+            return len(data)
+        if hasattr(os, 'preadv'):
+            return os.preadv(f.fileno(), [buf], file_offset)
+        with self._lock:
+            f.seek(file_offset)
+            return f.readinto(buf) or 0
+
+    def advise(self, sequential: bool) -> None:
+        """Hint the OS whether upcoming reads are sequential or random
+
+        Applies to the files open now and to those opened later.
+        """
+        with self._lock:
+            self._sequential = sequential
+            for mm in self._maps.values():
+                self._advise_file(None, mm, sequential)
+            for f in self._unmapped.values():
+                self._advise_file(f, None, sequential)
+
+    @staticmethod
+    def _advise_file(f: Optional[BinaryIO], mm: Optional[mmap.mmap], sequential: bool) -> None:
+        """Apply an access pattern hint to one split file's mapping and/or descriptor"""
+        madv = getattr(mmap, 'MADV_SEQUENTIAL' if sequential else 'MADV_RANDOM', None)
+        fadv = getattr(os, 'POSIX_FADV_SEQUENTIAL' if sequential else 'POSIX_FADV_RANDOM', None)
+        try:
+            if mm is not None and madv is not None:
+                mm.madvise(madv)
+            if f is not None and fadv is not None:
+                os.posix_fadvise(f.fileno(), 0, 0, fadv)
+        except OSError:
+            pass  # Advice only, never fatal
+
+    def prefetch(self, file_index: int, file_offset: int, size: int) -> None:
+        """Ask the OS to start reading a range of one split file in the background"""
+        try:
+            mm, f = self._handle(file_index)
+            if mm is not None and hasattr(mmap, 'MADV_WILLNEED'):
+                start = file_offset - file_offset % mmap.PAGESIZE  # Must be page aligned
+                if start < len(mm):
+                    mm.madvise(mmap.MADV_WILLNEED, start, min(size + file_offset - start, len(mm) - start))
+            elif f is not None and file_index not in self._direct and hasattr(os, 'POSIX_FADV_WILLNEED'):
+                os.posix_fadvise(f.fileno(), file_offset, size, os.POSIX_FADV_WILLNEED)
+        except (OSError, ValueError):
+            pass  # Advice only, never fatal
+
+    def is_mapped(self, offset: int, size: int) -> bool:
+        """Whether an image range is read from memory mappings already open
+
+        Nothing is opened, mapped or evicted: a range in a split file not
+        open yet, or whose mapping was evicted, counts as unmapped.
+        """
+        location = self._locate(offset)
+        if location is None:
+            return False
+        segments = list(self._segments(*location, size))
+        with self._lock:
+            return all(file_index in self._maps for file_index, _, _ in segments)
+
+    def prefetch_ranges(self, ranges: List[Tuple[int, int]]) -> None:
+        """Ask the OS to start reading several (offset, size) image ranges at once
+
+        Issued before a batch of reads, so the ranges are fetched concurrently
+        rather than one read at a time.
+        """
+        for offset, size in ranges:
+            location = self._locate(offset)
+            if location is None:
+                continue
+            for segment in self._segments(*location, size):
+                self.prefetch(*segment)
+
     def read(self, offset: int, size: int) -> Optional[bytes]:
         """Read data from split files at given offset"""
         try:
             # Find which file contains the offset
-            file_size = os.path.getsize(f"{self.base_path}.001")
-            file_index = offset // file_size
-            if file_index >= len(self.files):
+            location = self._locate(offset)
+            if location is None:
                 return None
-                
-            # Calculate offset within file
-            file_offset = offset % file_size
-            
-            # Read from file
-            self.files[file_index].seek(file_offset)
-            data = self.files[file_index].read(size)
-            
-            # Handle reads that span multiple files
-            remaining = size - len(data)
-            while remaining > 0 and file_index + 1 < len(self.files):
-                file_index += 1
-                next_data = self.files[file_index].read(remaining)
-                if not next_data:
-                    break
-                data += next_data
-                remaining -= len(next_data)
-                
-            return data
+            
+            # Read each piece, joining them once if the read spans files
+            parts = [self._read_file(*segment) for segment in self._segments(*location, size)]
+            if len(parts) == 1:
+                return parts[0]
+            return b''.join(parts)
             
         except Exception as e:
             print(f"Error reading from split files: {str(e)}")
             return None
+
+    def read_view(self, offset: int, size: int) -> Optional[memoryview]:
+        """Read data from split files at given offset as a memoryview
+
+        A range inside one mapped file is returned as a view of the mapping,
+        without copying, and must be released before close(). Other ranges
+        are read as with read().
+        """
+        location = self._locate(offset)
+        if location is None:
+            return None
+        file_index, file_offset = location
+        mm, _ = self._handle(file_index)
+        if mm is not None and file_offset + size <= len(mm):
+            return memoryview(mm)[file_offset:file_offset + size]
+        data = self.read(offset, size)
+        return memoryview(data) if data is not None else None
+
+    def readinto(self, offset: int, buf) -> int:
+        """Read from split files at given offset into buf, returns bytes read"""
+        try:
+            # Find which file contains the offset
+            location = self._locate(offset)
+            if location is None:
+                return 0
+
+            # Fill buf, continuing into following files if the read spans them
+            view = memoryview(buf)
+            total = 0
+            for file_index, file_offset, length in self._segments(*location, len(view)):
+                n = self._readinto_file(file_index, file_offset, view[total:total + length])
+                total += n
+                if n < length:
+                    break
+
+            return total
+
+        except Exception as e:
+            print(f"Error reading from split files: {str(e)}")
+            return 0
             
     def close(self):
         """Close all open files"""
-        for f in self.files:
+        with self._lock:
+            maps = list(self._maps.values())
+            files = list(self._unmapped.values())
+            self._maps.clear()
+            self._unmapped.clear()
+            self._direct.clear()
+        for mm in maps:
+            try:
+                mm.close()
+            except BufferError:
+                pass  # A view is still held, the mapping goes when it does
+        for f in files:
             f.close()
 
     def read_ftk_header(self) -> Optional[dict]:
         """Read and parse FTK Imager logical image header"""
         try:
-            # Read first chunk of first file
-            header_data = self.read(0, 512)
-            if not header_data:
+            # Read the first 32 sectors once, the header is the first of them
+            blocks = self.read(0, 16384)
+            if not blocks:
                 return None
             
             print("\nAnalyzing FTK Image header:")
-            print(f"First 32 bytes: {binascii.hexlify(header_data[:32]).decode()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("First 32 bytes: %s", binascii.hexlify(blocks[:32]).decode())
             
             # FTK logical images typically start with case information
             # and then the actual NTFS data follows
             
             # Look for NTFS signature in first few blocks
-            for offset in range(0, 16384, 512):  # Check first 32 sectors
-                sector = self.read(offset, 512)
-                if not sector:
-                    continue
-                
-                if sector[3:7] == b'NTFS':
-                    print(f"\nFound NTFS signature at offset {offset}")
-                    return {
-                        'type': 'FTK Logical',
-                        'ntfs_offset': offset,
-                        'sector_size': 512
-                    }
+            offset = self._find_sector_signature(blocks, _BOOT_SECTOR_RE, 0, len(blocks))
+            if offset >= 0:
+                print(f"\nFound NTFS signature at offset {offset}")
+                return {
+                    'type': 'FTK Logical',
+                    'ntfs_offset': offset,
+                    'sector_size': 512
+                }
                     
             return None
             
@@ -115,62 +365,149 @@ class SplitImageFile:
             print(f"Error reading FTK header: {str(e)}")
             return None
 
+    @staticmethod
+    def _find_sector_signature(data, sector_re: 're.Pattern[bytes]', start: int, end: int) -> int:
+        """Find the first 512-byte sector in data[start:end] matched by one of
+        the *_SECTOR_RE patterns, returning its offset in data or -1"""
+        match = sector_re.match(data, start, end)
+        return match.start(1) if match else -1
+
+    def _rfind_boot_sector(self, offset: int, window: int = 65536) -> Optional[int]:
+        """Find the closest NTFS boot sector at or up to window bytes before offset"""
+        low = offset - min(window // 512 - 1, offset // 512) * 512
+        size = offset - low + 512
+
+        # A window inside one mapped file is searched in place, otherwise
+        # it is read once
+        data = None
+        location = self._locate(low)
+        if location is not None:
+            file_index, start = location
+            mm, _ = self._handle(file_index)
+            if mm is not None and start + size <= len(mm):
+                data = mm
+        if data is None:
+            data, start = self.read(low, size), 0
+            if not data:
+                return None
+
+        end = min(start + size, len(data))
+        pos = data.rfind(b'NTFS', start + 3, end)
+        while pos >= 0:
+            if (pos - 3 - start) % 512 == 0:
+                return low + pos - 3 - start
+            pos = data.rfind(b'NTFS', start + 3, pos + 3)
+        return None
+
+    def _scan_file(self, file_idx: int, first_hit: List[int]) -> Optional[Tuple[int, str]]:
+        """Scan one split file for the start of the NTFS volume
+
+        Returns (offset, message) for the first hit in the file, or None.
+        Stops early once first_hit[0] names an earlier file with a hit.
+        """
+        # For FTK logical images, we need to scan more thoroughly
+        # Try larger chunks to find valid data
+        chunk_size = 65536  # 64KB chunks
+        file_size = self.file_sizes[file_idx]
+        base_offset = self._cum_offsets[file_idx]
+        
+        # Mapped files are searched in place, without copying chunks out
+        mm, _ = self._handle(file_idx)
+        
+        # Scan through the file
+        for chunk_offset in range(0, file_size, chunk_size):
+            if first_hit[0] < file_idx:
+                return None
+            if chunk_offset % (1024*1024) == 0:  # Progress indicator every 1MB
+                logger.debug("Scanning file %d offset: %d bytes", file_idx + 1, chunk_offset)
+            
+            # Keep the next PREFETCH_DEPTH chunks queued while this one is scanned
+            if chunk_offset % (chunk_size * PREFETCH_DEPTH) == 0:
+                self.prefetch(file_idx, chunk_offset, 2 * chunk_size * PREFETCH_DEPTH)
+                
+            if mm is not None:
+                chunk, start = mm, chunk_offset
+                end = min(chunk_offset + chunk_size, file_size)
+            else:
+                chunk = self.read(base_offset + chunk_offset, chunk_size)
+                if not chunk:
+                    continue
+                start, end = 0, len(chunk)
+            
+            # Skip chunks where no sector can hold either signature: strided
+            # slices pick out the first signature byte of every sector
+            if b'N' not in chunk[start + 3:end:512] and b'F' not in chunk[start:end:512]:
+                continue
+            
+            # Look for NTFS signature or common NTFS structures
+            ntfs_pos = self._find_sector_signature(chunk, _BOOT_SECTOR_RE, start, end)
+            cursor = start
+            while True:
+                file_pos = self._find_sector_signature(chunk, _FILE_RECORD_SECTOR_RE, cursor, end)
+                
+                # Check for NTFS signature
+                if ntfs_pos >= 0 and (file_pos < 0 or ntfs_pos <= file_pos):
+                    found_offset = base_offset + chunk_offset + ntfs_pos - start
+                    return found_offset, f"\nFound NTFS signature at offset {found_offset:,}"
+                if file_pos < 0:
+                    break
+                
+                # Check for MFT entry signature "FILE"
+                file_offset = base_offset + chunk_offset + file_pos - start
+                logger.debug("Possible MFT entry found at %d", file_offset)
+                # Look backwards for NTFS boot sector
+                boot_search_start = max(0, file_offset - 16384)
+                logger.debug("Searching backwards from %d for boot sector", boot_search_start)
+                
+                back_offset = self._rfind_boot_sector(boot_search_start)
+                if back_offset is not None:
+                    return back_offset, f"Found NTFS boot sector at {back_offset:,}"
+                cursor = file_pos + 512
+        
+        return None
+
     def find_ntfs_partition(self) -> Optional[int]:
         """Find the start offset of the NTFS volume in FTK logical image"""
         try:
             print("\nAnalyzing FTK logical image...")
+            self.advise(sequential=True)
+            
+            # Split files are scanned concurrently; a hit in one file stops
+            # the scans of the files after it
+            first_hit = [len(self.paths)]  # Earliest file index with a hit
+            hit_lock = threading.Lock()
             
-            # For FTK logical images, we need to scan more thoroughly
-            # Try larger chunks to find valid data
-            chunk_size = 65536  # 64KB chunks
+            def scan(file_idx: int) -> Optional[Tuple[int, str]]:
+                result = self._scan_file(file_idx, first_hit)
+                if result is not None:
+                    with hit_lock:
+                        first_hit[0] = min(first_hit[0], file_idx)
+                return result
             
-            for file_idx, file_size in enumerate(self.file_sizes):
+            workers = max(1, min(len(self.paths), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(scan, range(len(self.paths))))
+            
+            # Report in file order, as a serial scan would
+            for file_idx, result in enumerate(results):
                 print(f"\nScanning file {file_idx + 1} ({self.file_sizes[file_idx]} bytes)")
-                base_offset = sum(self.file_sizes[:file_idx])
-                
-                # Scan through the file
-                for chunk_offset in range(0, file_size, chunk_size):
-                    if chunk_offset % (1024*1024) == 0:  # Progress indicator every 1MB
-                        print(f"Scanning offset: {chunk_offset:,} bytes")
-                        
-                    chunk = self.read(base_offset + chunk_offset, chunk_size)
-                    if not chunk:
-                        continue
-                    
-                    # Look for NTFS signature or common NTFS structures
-                    for i in range(0, len(chunk) - 512, 512):
-                        sector = chunk[i:i+512]
-                        
-                        # Check for NTFS signature
-                        if sector[3:7] == b'NTFS':
-                            found_offset = base_offset + chunk_offset + i
-                            print(f"\nFound NTFS signature at offset {found_offset:,}")
-                            return found_offset
-                        
-                        # Check for MFT entry signature "FILE"
-                        if sector[0:4] == b'FILE':
-                            print(f"\nPossible MFT entry found at {base_offset + chunk_offset + i:,}")
-                            # Look backwards for NTFS boot sector
-                            boot_search_start = max(0, base_offset + chunk_offset + i - 16384)
-                            print(f"Searching backwards from {boot_search_start:,} for boot sector")
-                            
-                            for back_offset in range(boot_search_start, boot_search_start - 65536, -512):
-                                if back_offset < 0:
-                                    break
-                                boot_sector = self.read(back_offset, 512)
-                                if boot_sector and boot_sector[3:7] == b'NTFS':
-                                    print(f"Found NTFS boot sector at {back_offset:,}")
-                                    return back_offset
+                if result is not None:
+                    found_offset, message = result
+                    print(message)
+                    return found_offset
                 
-                # If no signature found, look for other NTFS indicators
-                print(f"\nChecking file {file_idx + 1} for NTFS structures...")
-                sample_offset = base_offset
+                # If no signature found, dump the start of the file for debugging
+                if not logger.isEnabledFor(logging.DEBUG):
+                    continue
+                logger.debug("Checking file %d for NTFS structures...", file_idx + 1)
+                sample_offset = self._cum_offsets[file_idx]
                 sample = self.read(sample_offset, 512)
                 if sample:
-                    print(f"Sample data at offset {sample_offset:,}:")
-                    print(f"First 16 bytes: {binascii.hexlify(sample[:16]).decode()}")
-                    print(f"Bytes 3-7: {sample[3:7]}")
-                    print(f"Possible signatures: {[sample[i:i+8] for i in range(0, 512, 8) if any(c != 0 for c in sample[i:i+8])]}")
+                    logger.debug("Sample data at offset %d:", sample_offset)
+                    logger.debug("First 16 bytes: %s", binascii.hexlify(sample[:16]).decode())
+                    logger.debug("Bytes 3-7: %r", sample[3:7])
+                    logger.debug("Possible signatures: %r",
+                                 [sample[i:i+8] for i in range(0, 512, 8) if any(sample[i:i+8])])
             
             print("\nNo valid NTFS structures found. This might be:")
             print("1. An encrypted or compressed FTK image")
@@ -185,7 +522,7 @@ class SplitImageFile:
             
         except Exception as e:
             print(f"Error analyzing FTK image: {str(e)}")
-            print("Stack trace:", traceback.format_exc())
+            logger.debug("Stack trace:", exc_info=True)
             return None 
 
     def check_ftk_format(self) -> bool:
@@ -197,10 +534,11 @@ class SplitImageFile:
                 return False
             
             print("\nAnalyzing file format:")
-            print(f"First 32 bytes: {binascii.hexlify(header[:32]).decode()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("First 32 bytes: %s", binascii.hexlify(header[:32]).decode())
             
             # Check for known FTK signatures or patterns
-            if all(b == 0 for b in header):
+            if not header.strip(b'\x00'):
                 print("Warning: First sector is all zeros")
             
             # Check file sizes
@@ -209,11 +547,12 @@ class SplitImageFile:
                 print(f"File {i+1}: {size:,} bytes ({size/1024/1024:.2f} MB)")
             
             # Look for common patterns
-            patterns = [b'FTK', b'NTFS', b'FILE', b'MFT']
-            for pattern in patterns:
-                for i in range(min(4096, len(header)-len(pattern))):
-                    if header[i:i+len(pattern)] == pattern:
-                        print(f"Found {pattern} signature at offset {i}")
+            found = {pattern: [] for pattern in HEADER_SIGNATURES}
+            for match in _HEADER_SIGNATURES_RE.finditer(header):
+                found[match.group(1)].append(match.start())
+            for pattern, offsets in found.items():
+                for i in offsets:
+                    print(f"Found {pattern} signature at offset {i}")
             
             return True
             
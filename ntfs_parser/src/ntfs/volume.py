@@ -1,88 +1,211 @@
-from typing import Optional, Dict, List, Generator
+from typing import Callable, Optional, Dict, Iterator, List, Generator, Tuple
 from .boot_sector import NTFSBootSector
-from .mft import MFTEntry, MFTAttribute
+from .mft import MFTEntry, MFTAttribute, DataRun
 from ..core.buffer import BufferPool, Buffer
 from ..core.errors import Result, NTFSError
+from collections import OrderedDict, deque
+import codecs
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import os
 import binascii
 import logging
+import struct
+import threading
 from .split_volume import SplitImageFile
-import traceback
+
+MFT_ENTRY_SIZE = 1024  # Standard MFT entry size
+WRITE_BUFFER_SIZE = 1024 * 1024  # Output buffer for extracted files
+MFT_READ_GROUP = 16  # MFT entries fetched together by read_mft_entry
+FIXUP_STRIDE = 512  # Bytes covered by each update sequence array entry
+MFT_GROUP_CACHE_SIZE = 256  # Raw entry groups kept (4 MiB at 16 entries)
+MFT_BULK_READ_SIZE = 64 * 1024  # Largest single read when loading several entry groups
+MFT_READ_WORKERS = 8  # Threads issuing those reads concurrently
+PARALLEL_PARSE_MIN_ENTRIES = 65536  # MFT size from which deleted records are parsed in worker processes
+PARSE_BATCH_ENTRIES = 1024  # Raw records sent to a worker process at a time
+LAST_SYSTEM_FILE_REF = 11  # $MFT through $Extend, hidden from directory listings
+
+# $STANDARD_INFORMATION content: creation time, modification time
+_STANDARD_INFO_TIMES = struct.Struct('<QQ')
+
+# $FILE_NAME content: parent reference, file name length, namespace
+_FILE_NAME_HDR = struct.Struct('<Q56xBB')
+
+# MBR partition table entry: partition type, starting LBA
+_MBR_PARTITION = struct.Struct('<4xB3xI4x')
+
+# $INDEX_ROOT header: indexed attribute type, collation rule, index record
+# size, clusters per index record
+_INDEX_ROOT_HDR = struct.Struct('<IIIB3x')
+
+# Index node header: entries offset, total size, allocated size, flags
+_INDEX_NODE_HDR = struct.Struct('<IIIB3x')
+
+# INDX block header: update sequence array offset and count
+_INDEX_BLOCK_HDR = struct.Struct('<4xHH')
+
+# $INDEX_ROOT entry as read by _list_directory: entry length, file reference,
+# then the $FILE_NAME key's name length
+_ROOT_ENTRY = struct.Struct('<I4xQ64xB')
+
+# INDX block entry: file reference, entry length, key length, flags, then the
+# $FILE_NAME key's name length
+_INDEX_ENTRY = struct.Struct('<QHHB3x64xB')
+
+# Offset of the name from the start of an index entry: 16 byte entry header,
+# 66 bytes of $FILE_NAME before the name
+_INDEX_NAME_OFFSET = 16 + 66
+
+# Deleted file as sent back by a worker process: entry number, UTF-16LE
+# name, size, is directory, creation time, modification time
+_DeletedSummary = Tuple[int, bytes, int, bool, Optional[int], Optional[int]]
+
+# Bound once: bytes.decode('utf-16le') looks the codec up by name on every call
+_utf_16_le_decode = codecs.utf_16_le_decode
+
+def _decode_name(name_utf16: bytes, errors: str = 'strict') -> str:
+    """Decode a UTF-16LE file name"""
+    return _utf_16_le_decode(name_utf16, errors, True)[0]
+
+def _decode_names(names: List[memoryview]) -> List[Optional[str]]:
+    """Decode a batch of UTF-16LE file names, None for any that are invalid
+
+    The batch is decoded with a single codec call. If it holds an invalid
+    sequence or a surrogate pair it can no longer be split back by length,
+    so its names are decoded one at a time instead.
+    """
+    lengths = [len(name) >> 1 for name in names]
+    try:
+        # No separate ASCII path: the codec already special-cases runs of
+        # ASCII code units in C, and testing the high bytes and decoding the
+        # low ones as Latin-1 from Python is several times slower
+        joined = _utf_16_le_decode(b''.join(names), 'strict', True)[0]
+    except UnicodeDecodeError:
+        joined = None
+
+    decoded: List[Optional[str]] = []
+    if joined is None or len(joined) != sum(lengths):
+        for name in names:
+            try:
+                decoded.append(_decode_name(name))
+            except UnicodeDecodeError:
+                decoded.append(None)
+        return decoded
+
+    pos = 0
+    for length in lengths:
+        decoded.append(joined[pos:pos + length])
+        pos += length
+    return decoded
+
+def _summarize_entry(entry: MFTEntry, logger: logging.Logger) -> Tuple[Optional[str], bytes, int, Optional[int], Optional[int]]:
+    """Parse the attributes an NTFSFile keeps, looking up only the types used
+
+    Returns (name, name_utf16, size, creation_time, modification_time); name
+    is None unless the attribute already carried it decoded.
+    """
+    name = None
+    name_utf16 = b''
+    size = 0
+    creation_time = modification_time = None
+    attributes_by_type = entry.attributes_by_type
+    
+    for attr in attributes_by_type.get(0x30, ()):  # $FILE_NAME
+        try:
+            if not name and not name_utf16:  # Only set if not already set
+                if hasattr(attr, 'name') and attr.name:
+                    name = attr.name
+                    name_utf16 = attr.name.encode('utf-16le')
+                elif attr.resident and len(attr.data) > 66:
+                    _, name_length, _ = _FILE_NAME_HDR.unpack_from(attr.data)
+                    name_utf16 = attr.data[66:66+name_length*2]
+        except Exception as e:
+            logger.error("Error parsing attribute %d: %s", attr.type_id, e)
+    
+    for attr in attributes_by_type.get(0x80, ()):  # $DATA
+        # Only use unnamed $DATA attribute for size
+        if not hasattr(attr, 'name') or not attr.name:
+            if not attr.resident:
+                # For non-resident, use data_size
+                if hasattr(attr, 'data_size'):
+                    size = attr.data_size
+            else:
+                # For resident, use actual data length
+                size = len(attr.data)
+    
+    for attr in attributes_by_type.get(0x10, ()):  # $STANDARD_INFORMATION
+        try:
+            if attr.resident and len(attr.data) >= 24:
+                # Parse timestamps
+                creation_time, modification_time = _STANDARD_INFO_TIMES.unpack_from(attr.data)
+        except Exception as e:
+            logger.error("Error parsing attribute %d: %s", attr.type_id, e)
+    
+    # Fix: Set size to 0 for directories
+    if entry.is_dir:
+        size = 0
+    return name, name_utf16, size, creation_time, modification_time
 
 class NTFSFile:
-    def __init__(self, mft_entry: MFTEntry, volume: 'NTFSVolume'):
-        self.mft_entry = mft_entry
+    # One instance per listed file; slots keep wide directory listings small
+    __slots__ = ('_mft_entry', 'reference', 'volume', 'name_utf16', '_name',
+                 'size', 'is_directory', 'creation_time', 'modification_time')
+
+    def __init__(self, mft_entry: Optional[MFTEntry], volume: 'NTFSVolume'):
+        self._mft_entry = mft_entry
         self.volume = volume
-        self.name = None
-        self.size = 0
-        self.is_directory = self.mft_entry.is_directory()
-        self.creation_time = None
-        self.modification_time = None
-        self._parse_attributes()
-        
-        # Fix: Set size to 0 for directories
-        if self.is_directory:
-            self.size = 0
-        
-    def _parse_attributes(self):
-        """Parse MFT entry attributes"""
-        for attr in self.mft_entry.attributes:
+        if mft_entry is None:
+            return  # Filled in by from_summary
+        self.reference = mft_entry.reference
+        self.is_directory = mft_entry.is_dir
+        (self._name, self.name_utf16, self.size,
+         self.creation_time, self.modification_time) = _summarize_entry(mft_entry, volume.logger)
+
+    @classmethod
+    def from_summary(cls, summary: _DeletedSummary,
+                     volume: 'NTFSVolume') -> 'NTFSFile':
+        """Build a file from a worker process summary, see _parse_deleted_records
+
+        The MFT entry itself is re-read only if the file's data is read.
+        """
+        file = cls(None, volume)
+        (file.reference, file.name_utf16, file.size, file.is_directory,
+         file.creation_time, file.modification_time) = summary
+        file._name = None
+        return file
+
+    @property
+    def mft_entry(self) -> MFTEntry:
+        """The file's MFT entry, read on first access for files built from a summary"""
+        if self._mft_entry is None:
+            entry_result = self.volume.read_mft_entry(self.reference, use_cache=False)
+            if entry_result.is_err():
+                raise IOError(entry_result.message)
+            self._mft_entry = entry_result.value
+        return self._mft_entry
+
+    @property
+    def name(self) -> Optional[str]:
+        """File name, decoded from UTF-16LE on first access"""
+        if self._name is None and self.name_utf16:
             try:
-                if attr.type_id == 0x30:  # $FILE_NAME
-                    if not self.name:  # Only set if not already set
-                        if hasattr(attr, 'name') and attr.name:
-                            self.name = attr.name
-                        elif attr.resident and len(attr.data) > 66:
-                            name_length = attr.data[64]
-                            self.name = attr.data[66:66+name_length*2].decode('utf-16le')
-                            
-                elif attr.type_id == 0x80:  # $DATA
-                    # Only use unnamed $DATA attribute for size
-                    if not hasattr(attr, 'name') or not attr.name:
-                        if not attr.resident:
-                            # For non-resident, use data_size
-                            if hasattr(attr, 'data_size'):
-                                self.size = attr.data_size
-                        else:
-                            # For resident, use actual data length
-                            self.size = len(attr.data)
-                        
-                elif attr.type_id == 0x10:  # $STANDARD_INFORMATION
-                    if attr.resident and len(attr.data) >= 24:
-                        # Parse timestamps
-                        self.creation_time = int.from_bytes(attr.data[0:8], 'little')
-                        self.modification_time = int.from_bytes(attr.data[8:16], 'little')
-                        
-            except Exception as e:
-                self.volume.logger.error(f"Error parsing attribute {attr.type_id}: {str(e)}")
+                self._name = _decode_name(self.name_utf16)
+            except UnicodeDecodeError as e:
+                self.volume.logger.error("Error decoding file name: %s", e)
+                self.name_utf16 = b''
+        return self._name
     
     def read_data(self) -> Result[bytes]:
         """Read file contents"""
         try:
             # Find the unnamed $DATA attribute
-            data_attr = None
-            for attr in self.mft_entry.attributes:
-                if attr.type_id == 0x80:  # $DATA
-                    if not hasattr(attr, 'name') or not attr.name:
-                        data_attr = attr
-                        break
-            
+            data_attr = self.mft_entry.get_attribute(0x80)
             if not data_attr:
                 return Result.ok(b'')  # No data attribute found
             
-            if data_attr.resident:
-                # Resident data - return directly
-                return Result.ok(data_attr.data)
-            else:
-                # Non-resident data - read from clusters
-                data = bytearray()
-                for run in data_attr.data_runs:
-                    buffer_result = self.volume.read_clusters(run.cluster, run.length)
-                    if buffer_result.is_err():
-                        return buffer_result
-                    data.extend(buffer_result.value)
-                
-                return Result.ok(bytes(data[:data_attr.data_size]))
+            # Resident data is returned directly, non-resident data is
+            # read from clusters one (coalesced) data run at a time
+            return data_attr.read_all(self.volume)
             
         except Exception as e:
             return Result.err(NTFSError.IO_ERROR, f"Failed to read file data: {str(e)}")
@@ -91,46 +214,205 @@ class NTFSFile:
         """Read data from a deleted file"""
         try:
             # Find the unnamed $DATA attribute
-            data_attr = None
-            for attr in self.mft_entry.attributes:
-                if attr.type_id == 0x80:  # $DATA
-                    if not hasattr(attr, 'name') or not attr.name:
-                        data_attr = attr
-                        break
-            
+            data_attr = self.mft_entry.get_attribute(0x80)
             if not data_attr:
                 return Result.ok(b'')  # No data attribute found
             
-            if data_attr.resident:
-                # Resident data - return directly
-                return Result.ok(data_attr.data)
-            else:
-                # For deleted files, only read what's still available
-                # Some clusters might be reallocated
-                data = bytearray()
-                for run in data_attr.data_runs:
-                    try:
-                        buffer_result = self.volume.read_clusters(run.cluster, run.length)
-                        if buffer_result.is_ok():
-                            data.extend(buffer_result.value)
-                    except:
-                        # Skip errors for deleted files
-                        continue
-                
-                return Result.ok(bytes(data[:data_attr.data_size]))
+            # For deleted files, only read what's still available
+            # Some clusters might be reallocated
+            return data_attr.read_all(self.volume, skip_errors=True)
             
         except Exception as e:
             return Result.err(NTFSError.IO_ERROR, f"Failed to read deleted file data: {str(e)}")
 
+def name_matcher(pattern: str) -> Callable[[NTFSFile], bool]:
+    """Build a case-insensitive file name substring predicate
+
+    ASCII patterns are matched against the raw UTF-16LE name with bytes.find,
+    so names that do not match are never decoded.
+    """
+    if not pattern.isascii():
+        needle_str = pattern.lower()
+
+        def match_decoded(file: NTFSFile) -> bool:
+            name = file.name  # None if missing or undecodable
+            return name is not None and needle_str in name.lower()
+
+        return match_decoded
+
+    needle = pattern.lower().encode('utf-16le')
+
+    def match(file: NTFSFile) -> bool:
+        haystack = file.name_utf16.lower()
+        pos = haystack.find(needle)
+        while pos >= 0:
+            if pos % 2 == 0:  # Must start on a character boundary
+                return True
+            pos = haystack.find(needle, pos + 1)
+        return False
+
+    return match
+
+def _file_name_link(entry: MFTEntry) -> Optional[Tuple[int, bytes]]:
+    """Get (parent entry number, UTF-16LE name) from an entry's $FILE_NAME
+
+    Win32/POSIX names are preferred over DOS 8.3 short names.
+    """
+    link = None
+    for attr in entry.attributes_by_type.get(0x30, []):
+        if not attr.resident or len(attr.data) <= 66:
+            continue
+        parent_ref, name_length, namespace = _FILE_NAME_HDR.unpack_from(attr.data)
+        parent_ref &= 0xFFFFFFFFFFFF  # Entry number, without the sequence number
+        name_utf16 = attr.data[66:66 + name_length * 2]
+        if namespace != 2:  # Not a DOS-only name
+            return parent_ref, name_utf16
+        if link is None:
+            link = parent_ref, name_utf16
+    return link
+
+def _apply_fixup(block: bytearray, usa_offset: int, usa_count: int) -> bool:
+    """Apply a multi-sector record's update sequence array in place
+
+    The last two bytes of each FIXUP_STRIDE sector are checked against the
+    update sequence number and replaced with the saved originals, all
+    sectors in one strided slice. Returns False if the array does not fit
+    or a sector does not carry the number (a torn write).
+    """
+    sectors = usa_count - 1
+    if (sectors < 0 or usa_offset % 2 or usa_offset + usa_count * 2 > len(block)
+            or sectors * FIXUP_STRIDE > len(block)):
+        return False
+
+    with memoryview(block).cast('H') as words:
+        usa_start = usa_offset // 2
+        stride = FIXUP_STRIDE // 2
+        tails = words[stride - 1:sectors * stride:stride]
+        if tails.tolist().count(words[usa_start]) != sectors:
+            return False
+        tails[:] = words[usa_start + 1:usa_start + usa_count]
+        tails.release()
+    return True
+
+def _index_root_entries(data: bytes, offset: int) -> List[Tuple[int, memoryview]]:
+    """Walk $INDEX_ROOT entries from offset, returning (file reference, UTF-16LE name)
+
+    Names are views into data, not copies. Entries with a zero file
+    reference or a name running past the data are left out. Past the last
+    offset a name could start from, nothing more can be returned, so the
+    walk stops there.
+    """
+    view = memoryview(data)
+    entries = []
+    append = entries.append
+    unpack_entry = _ROOT_ENTRY.unpack_from
+    end = len(data)
+    last = end - _INDEX_NAME_OFFSET
+    while offset <= last:
+        entry_length, file_ref, name_length = unpack_entry(data, offset)
+        if entry_length == 0 or offset + entry_length > end:
+            break
+
+        if file_ref != 0:
+            name_offset = offset + _INDEX_NAME_OFFSET
+            name_end = name_offset + name_length * 2
+            if name_end <= end:
+                append((file_ref, view[name_offset:name_end]))
+
+        offset += entry_length
+    return entries
+
+def _index_block_entries(data: bytes, offset: int) -> List[Tuple[int, memoryview]]:
+    """Walk the entries of one INDX block from offset, returning (file reference, UTF-16LE name)
+
+    Names are views into data, not copies. Stops at the last-entry marker,
+    or where no further name could fit. Entries whose key or name runs past
+    the data are left out.
+    """
+    view = memoryview(data)
+    entries = []
+    append = entries.append
+    unpack_entry = _INDEX_ENTRY.unpack_from
+    end = len(data)
+    last = end - _INDEX_NAME_OFFSET
+    # Entry lengths follow name lengths, so runs of equal-length entries are
+    # short in practice; a fixed-stride iter_unpack for them saved ~10% on a
+    # fully uniform block but cost more than that on mixed ones
+    while offset <= last:
+        file_ref, entry_length, key_length, flags, name_length = unpack_entry(data, offset)
+        if flags & 2 or entry_length == 0 or offset + entry_length > end:
+            break
+
+        if offset + 16 + key_length <= end:
+            name_offset = offset + _INDEX_NAME_OFFSET
+            name_end = name_offset + name_length * 2
+            if name_end <= end:
+                append((file_ref, view[name_offset:name_end]))
+
+        offset += entry_length
+    return entries
+
+def _without_system_files(entries: List[Tuple[int, memoryview]]) -> List[Tuple[int, memoryview]]:
+    """Drop the $ system files from walked index entries, before their names are decoded"""
+    return [(file_ref, name_utf16) for file_ref, name_utf16 in entries
+            if not (file_ref <= LAST_SYSTEM_FILE_REF and name_utf16[:2] == b'$\x00')]
+
+def _parse_deleted_record(entry_number: int, record) -> Optional[MFTEntry]:
+    """Parse a raw not-in-use MFT record, returning it only if it still has a name"""
+    entry_result = MFTEntry.from_bytes(record)
+    if entry_result.is_err():
+        return None
+    entry = entry_result.value
+    entry.reference = entry_number
+    if entry.in_use or not entry.has_filename:
+        return None
+    return entry
+
+def _parse_deleted_records(entry_numbers: List[int], data: bytes) -> List[_DeletedSummary]:
+    """Worker process side of list_deleted_files: parse a batch of back-to-back raw records
+
+    Only what NTFSFile.from_summary needs is sent back: whole MFTEntry
+    objects cost far more to pickle than the worker saves by parsing them.
+    """
+    logger = logging.getLogger('NTFSVolume')
+    view = memoryview(data)
+    summaries = []
+    for i, entry_number in enumerate(entry_numbers):
+        offset = i * MFT_ENTRY_SIZE
+        entry = _parse_deleted_record(entry_number, view[offset:offset + MFT_ENTRY_SIZE])
+        if entry is not None:
+            _, name_utf16, size, creation_time, modification_time = _summarize_entry(entry, logger)
+            summaries.append((entry_number, bytes(name_utf16), size, entry.is_dir,
+                              creation_time, modification_time))
+    return summaries
+
 class NTFSVolume:
-    def __init__(self, image_path: str):
+    def __init__(self, image_path: str, mft_cache_size: int = 4096, direct_io: bool = False):
         self.image_path = image_path
         self.image_file = None
         self.split_image = None
+        # Read the image bypassing the page cache (see SplitImageFile)
+        self.direct_io = direct_io
         self.boot_sector: Optional[NTFSBootSector] = None
+        # Image offsets of the partition and the MFT, bytes per cluster and
+        # its log2, set at mount
+        self.partition_offset = 0
+        self.mft_offset = 0
+        self.cluster_size = 0
+        self._cluster_shift = 0
         self.buffer_pool = BufferPool()
-        self.mft_cache: Dict[int, MFTEntry] = {}
-        logging.basicConfig(level=logging.DEBUG)
+        # LRU cache of parsed MFT entries, most recently used last
+        self.mft_cache: 'OrderedDict[int, MFTEntry]' = OrderedDict()
+        self.mft_cache_size = mft_cache_size
+        # LRU cache of raw MFT_READ_GROUP-entry blocks, so entries near one
+        # just read are parsed without further I/O
+        self._mft_group_cache: 'OrderedDict[int, memoryview]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Resolved paths: lowercase component -> [MFT reference, children]
+        self._path_trie: Dict[str, list] = {}
+        # Threads for concurrent MFT reads from unmapped split files, started
+        # on first use and shut down by close()
+        self._mft_read_pool: Optional[ThreadPoolExecutor] = None
         self.logger = logging.getLogger('NTFSVolume')
 
     def mount(self) -> Result[None]:
@@ -142,9 +424,11 @@ class NTFSVolume:
             base_path = self.image_path.rsplit('.', 1)[0]  # Remove .001 extension
             print(f"Base path: {base_path}")
             
-            self.split_image = SplitImageFile(base_path)
+            self.split_image = SplitImageFile(base_path, direct_io=self.direct_io)
             if not self.split_image.open():
                 return Result.err(NTFSError.IO_ERROR, "Failed to open split image files")
+            # MFT lookups and directory walks jump around the image
+            self.split_image.advise(sequential=False)
             
             # First read the MBR
             print("\nReading MBR...")
@@ -154,11 +438,10 @@ class NTFSVolume:
 
             # Parse partition table from MBR
             partition_offset = None
-            for i in range(4):  # Check all 4 primary partitions
-                offset = 0x1BE + (i * 16)  # Partition table starts at 0x1BE
-                partition_type = mbr_data[offset + 4]
+            # All 4 primary partition entries, starting at 0x1BE
+            for partition_type, start_lba in _MBR_PARTITION.iter_unpack(mbr_data[0x1BE:0x1FE]):
                 if partition_type == 0x07:  # NTFS partition type
-                    partition_offset = int.from_bytes(mbr_data[offset + 8:offset + 12], 'little') * 512
+                    partition_offset = start_lba * 512
                     print(f"Found NTFS partition at offset: {partition_offset}")
                     break
 
@@ -180,16 +463,27 @@ class NTFSVolume:
                 print(binascii.hexlify(boot_data).decode())
                 return Result.err(NTFSError.IO_ERROR, "Invalid NTFS signature in boot sector")
             
-            print("\nBoot sector details:")
-            print(f"NTFS signature: {boot_data[3:7]}")
-            print(f"Bytes per sector: {int.from_bytes(boot_data[0x0B:0x0D], 'little')}")
-            print(f"Sectors per cluster: {boot_data[0x0D]}")
-            
             boot_result = NTFSBootSector.from_bytes(boot_data)
             if boot_result.is_err():
                 return boot_result
 
             self.boot_sector = boot_result.value
+            
+            print("\nBoot sector details:")
+            print(f"NTFS signature: {boot_data[3:7]}")
+            print(f"Bytes per sector: {self.boot_sector.bytes_per_sector}")
+            print(f"Sectors per cluster: {self.boot_sector.sectors_per_cluster}")
+
+            # NTFS cluster sizes are powers of two, so cluster offsets are shifts
+            cluster_size = self.boot_sector.bytes_per_sector * self.boot_sector.sectors_per_cluster
+            if cluster_size <= 0 or cluster_size & (cluster_size - 1):
+                return Result.err(
+                    NTFSError.INVALID_BOOT_SECTOR,
+                    f"Cluster size is not a power of two: {cluster_size}"
+                )
+            self.cluster_size = cluster_size
+            self._cluster_shift = cluster_size.bit_length() - 1
+            self.mft_offset = partition_offset + (self.boot_sector.mft_lcn << self._cluster_shift)
             print("\nNTFS volume information:")
             print(f"Bytes per sector: {self.boot_sector.bytes_per_sector}")
             print(f"Sectors per cluster: {self.boot_sector.sectors_per_cluster}")
@@ -209,11 +503,8 @@ class NTFSVolume:
         if not self.boot_sector:
             return Result.err(NTFSError.INVALID_PARAMETER, "Volume not mounted")
             
-        offset = (self.partition_offset +  # Add partition offset
-                 cluster * self.boot_sector.sectors_per_cluster * 
-                 self.boot_sector.bytes_per_sector)
-        size = (count * self.boot_sector.sectors_per_cluster * 
-               self.boot_sector.bytes_per_sector)
+        offset = self.partition_offset + (cluster << self._cluster_shift)
+        size = count << self._cluster_shift
                
         try:
             if self.split_image:
@@ -221,38 +512,111 @@ class NTFSVolume:
                 if not data:
                     return Result.err(NTFSError.IO_ERROR, "Failed to read from split image")
                 return Result.ok(data)
+            elif hasattr(os, 'pread'):
+                # One positioned read, leaving the file position alone
+                return Result.ok(os.pread(self.image_file.fileno(), size, offset))
             else:
                 self.image_file.seek(offset)
                 return Result.ok(self.image_file.read(size))
         except Exception as e:
             return Result.err(NTFSError.IO_ERROR, f"Failed to read clusters: {str(e)}")
 
-    def read_mft_entry(self, entry_number: int) -> Result[MFTEntry]:
+    def readinto_clusters(self, cluster: int, count: int, buf: memoryview) -> Result[int]:
+        """Read clusters into buf, which must hold count clusters; returns bytes read"""
+        if not self.boot_sector:
+            return Result.err(NTFSError.INVALID_PARAMETER, "Volume not mounted")
+
+        offset = self.partition_offset + (cluster << self._cluster_shift)
+        target = buf[:count << self._cluster_shift]
+
+        try:
+            if self.split_image:
+                read = self.split_image.readinto(offset, target)
+                if not read:
+                    return Result.err(NTFSError.IO_ERROR, "Failed to read from split image")
+                return Result.ok(read)
+            elif hasattr(os, 'preadv'):
+                return Result.ok(os.preadv(self.image_file.fileno(), [target], offset))
+            else:
+                self.image_file.seek(offset)
+                return Result.ok(self.image_file.readinto(target) or 0)
+        except Exception as e:
+            return Result.err(NTFSError.IO_ERROR, f"Failed to read clusters: {str(e)}")
+
+    def prefetch_runs(self, runs: List[DataRun]) -> None:
+        """Hint that every one of these data runs is about to be read"""
+        if len(runs) < 2 or not self.boot_sector or not self.split_image:
+            return  # Nothing to overlap with a single read
+        shift = self._cluster_shift
+        self.split_image.prefetch_ranges([
+            (self.partition_offset + (run.cluster << shift), run.length << shift)
+            for run in runs if run.cluster is not None  # Sparse runs have nothing to read
+        ])
+
+    def read_clusters_view(self, cluster: int, count: int) -> Result[memoryview]:
+        """Read clusters as a memoryview, without copying if they lie in one split file
+
+        The view may reference the image mapping, so it must not be kept
+        past close().
+        """
+        if not self.boot_sector or not self.split_image:
+            read_result = self.read_clusters(cluster, count)
+            if read_result.is_err():
+                return read_result
+            return Result.ok(memoryview(read_result.value))
+
+        offset = self.partition_offset + (cluster << self._cluster_shift)
+        view = self.split_image.read_view(offset, count << self._cluster_shift)
+        if not view:
+            return Result.err(NTFSError.IO_ERROR, "Failed to read from split image")
+        return Result.ok(view)
+
+    def read_mft_entry(self, entry_number: int, use_cache: bool = True) -> Result[MFTEntry]:
+        """Read and parse one MFT entry
+
+        Bulk scans pass use_cache=False to read just this entry without
+        touching the caches, so they do not evict entries kept for lookups.
+        """
         try:
             # Check cache first
-            if entry_number in self.mft_cache:
-                return Result.ok(self.mft_cache[entry_number])
+            entry = None
+            if use_cache:
+                with self._cache_lock:
+                    entry = self.mft_cache.get(entry_number)
+                    if entry is not None:
+                        self.mft_cache.move_to_end(entry_number)
+            if entry is not None:
+                return Result.ok(entry)
 
             if not self.boot_sector:
                 return Result.err(NTFSError.INVALID_PARAMETER, "Volume not mounted")
 
-            # Calculate MFT entry location
-            mft_offset = (self.partition_offset +  # Add partition offset
-                         self.boot_sector.mft_lcn * 
-                         self.boot_sector.sectors_per_cluster * 
-                         self.boot_sector.bytes_per_sector)
-            entry_size = 1024  # Standard MFT entry size
-            offset = mft_offset + (entry_number * entry_size)
-            
-            self.logger.debug(f"Reading MFT entry {entry_number} from offset {offset}")
+            # Read the group of entries around this one with a single read
+            group, index = divmod(entry_number, MFT_READ_GROUP)
+            group_data = None
+            if not use_cache:
+                group_data = self._read_mft_range(entry_number, 1)
+                if not group_data:
+                    return Result.err(NTFSError.IO_ERROR, f"Failed to read MFT entry {entry_number}")
+                index = 0
+            else:
+                with self._cache_lock:
+                    group_data = self._mft_group_cache.get(group)
+                    if group_data is not None:
+                        self._mft_group_cache.move_to_end(group)
+            if group_data is None:
+                group_data = self._read_mft_range(group * MFT_READ_GROUP, MFT_READ_GROUP)
+                if not group_data:
+                    return Result.err(NTFSError.IO_ERROR, f"Failed to read MFT entry {entry_number}")
+                with self._cache_lock:
+                    self._mft_group_cache[group] = group_data
+                    if len(self._mft_group_cache) > MFT_GROUP_CACHE_SIZE:
+                        self._mft_group_cache.popitem(last=False)
 
-            # Read MFT entry using split image
-            entry_data = self.split_image.read(offset, entry_size)
+            offset = index * MFT_ENTRY_SIZE
+            entry_data = memoryview(group_data)[offset:offset + MFT_ENTRY_SIZE]
             if not entry_data:
                 return Result.err(NTFSError.IO_ERROR, f"Failed to read MFT entry {entry_number}")
-            
-            # Debug: Print first few bytes
-            self.logger.debug(f"MFT Entry {entry_number} data starts with: {entry_data[:16].hex()}")
 
             entry_result = MFTEntry.from_bytes(entry_data)
             if entry_result.is_err():
@@ -261,19 +625,275 @@ class NTFSVolume:
             entry = entry_result.value
             entry.reference = entry_number
             
-            # Debug: Print attributes
-            self.logger.debug(f"MFT Entry {entry_number} has {len(entry.attributes)} attributes")
-            for attr in entry.attributes:
-                self.logger.debug(f"Attribute type: 0x{attr.type_id:02x}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("MFT Entry %d data starts with: %s", entry_number, bytes(entry_data[:16]).hex())
+                self.logger.debug("MFT Entry %d has %d attributes", entry_number, len(entry.attributes))
+                for attr in entry.attributes:
+                    self.logger.debug("Attribute type: 0x%02x", attr.type_id)
 
-            # Cache the entry
-            self.mft_cache[entry_number] = entry
+            # Cache the entry, evicting the least recently used one if full
+            if use_cache:
+                with self._cache_lock:
+                    self.mft_cache[entry_number] = entry
+                    if len(self.mft_cache) > self.mft_cache_size:
+                        self.mft_cache.popitem(last=False)
             
             return Result.ok(entry)
 
         except Exception as e:
             return Result.err(NTFSError.IO_ERROR, f"Failed to read MFT entry {entry_number}: {str(e)}")
 
+    def prefetch_mft_entries(self, entry_numbers: List[int]) -> None:
+        """Load the MFT entries about to be read into the group cache
+
+        The MFT_READ_GROUP blocks read_mft_entry would fetch, minus those
+        already cached, are sorted and blocks lying within
+        MFT_BULK_READ_SIZE of each other are read together, gaps included.
+        Reads from unmapped split files (or with direct_io) go through the
+        volume's pool of MFT_READ_WORKERS threads, so several positioned
+        reads can be in flight at once. Mapped ranges are only sliced, with
+        no I/O to overlap, and are loaded in this thread.
+        """
+        if len(entry_numbers) < 2 or not self.boot_sector or not self.split_image:
+            return  # Nothing to combine with a single read
+        groups = {entry_number // MFT_READ_GROUP for entry_number in entry_numbers}
+        with self._cache_lock:
+            groups.difference_update(self._mft_group_cache)
+        # Loading more than the cache holds would evict the first groups again
+        groups = sorted(groups)[:MFT_GROUP_CACHE_SIZE]
+        if not groups:
+            return
+
+        group_size = MFT_READ_GROUP * MFT_ENTRY_SIZE
+        span_groups = max(1, MFT_BULK_READ_SIZE // group_size)
+        spans = []
+        for group in groups:
+            if spans and group - spans[-1][0] < span_groups:
+                spans[-1][1] = group + 1
+            else:
+                spans.append([group, group + 1])
+        self.split_image.prefetch_ranges([
+            (self.mft_offset + first * group_size, (end - first) * group_size)
+            for first, end in spans
+        ])
+
+        def load(span: List[int]) -> None:
+            first, end = span
+            data = self._read_mft_range(first * MFT_READ_GROUP, (end - first) * MFT_READ_GROUP)
+            if not data:
+                return  # read_mft_entry reports the failure
+            with self._cache_lock:
+                for group in range(first, end):
+                    offset = (group - first) * group_size
+                    if offset + group_size > len(data) or group in self._mft_group_cache:
+                        continue
+                    self._mft_group_cache[group] = data[offset:offset + group_size]
+                    if len(self._mft_group_cache) > MFT_GROUP_CACHE_SIZE:
+                        self._mft_group_cache.popitem(last=False)
+
+        unmapped = [span for span in spans if not self.split_image.is_mapped(
+            self.mft_offset + span[0] * group_size, (span[1] - span[0]) * group_size)]
+        if len(unmapped) < 2:
+            unmapped = []  # A single read has nothing to overlap with
+        for span in spans:
+            if span not in unmapped:
+                load(span)
+        if unmapped:
+            list(self._get_mft_read_pool().map(load, unmapped))  # Re-raise any read error here
+
+    def _get_mft_read_pool(self) -> ThreadPoolExecutor:
+        """The volume's MFT read threads, started on first use"""
+        with self._cache_lock:
+            if self._mft_read_pool is None:
+                self._mft_read_pool = ThreadPoolExecutor(max_workers=MFT_READ_WORKERS,
+                                                         thread_name_prefix='mft-read')
+            return self._mft_read_pool
+
+    def _read_mft_range(self, start_entry: int, count: int) -> Optional[memoryview]:
+        """Read count consecutive raw MFT entries with one read
+
+        Entries inside one mapped split file come back as a view of the
+        mapping, without copying. The mapping is advised for random access,
+        so a range of several entries is first requested as a whole rather
+        than faulted in a page at a time.
+        """
+        offset = self.mft_offset + start_entry * MFT_ENTRY_SIZE
+        size = count * MFT_ENTRY_SIZE
+        self.logger.debug("Reading MFT entries %d-%d from offset %d",
+                          start_entry, start_entry + count - 1, offset)
+        if count > 1:
+            self.split_image.prefetch_ranges([(offset, size)])
+        return self.split_image.read_view(offset, size)
+
+    def _get_mft_layout(self) -> Tuple[List[DataRun], int]:
+        """Get the data runs and size of the $MFT stream"""
+        mft_result = self.read_mft_entry(0)
+        if mft_result.is_ok():
+            for attr in mft_result.value.attributes_by_type.get(0x80, []):
+                if not attr.name and not attr.resident and attr.data_runs:
+                    return attr.data_runs, attr.data_size
+
+        # $MFT unreadable, assume a contiguous MFT and scan the first 100K entries
+        self.logger.warning("Could not read $MFT data runs, assuming contiguous MFT")
+        size = 100000 * MFT_ENTRY_SIZE
+        return [DataRun(cluster=self.boot_sector.mft_lcn, length=-(-size >> self._cluster_shift))], size
+
+    def _get_mft_bitmap(self) -> Optional[bytes]:
+        """Get the $MFT $BITMAP attribute, one bit per allocated MFT entry"""
+        mft_result = self.read_mft_entry(0)
+        if mft_result.is_err():
+            return None
+        for attr in mft_result.value.attributes_by_type.get(0xB0, []):
+            if not attr.name:
+                bitmap_result = attr.read_all(self)
+                if bitmap_result.is_ok():
+                    return bitmap_result.value
+        return None
+
+    def iter_mft_entries(self, batch_bytes: int = 4 * 1024 * 1024,
+                         allocated_only: bool = False) -> Generator[Tuple[int, memoryview], None, None]:
+        """Sequentially scan the MFT, yielding (entry number, raw record)
+
+        The $MFT data runs are read in batch_bytes chunks and sliced in memory,
+        so a full scan costs one read per chunk instead of one per entry.
+        Records may be views of the image mapping; copy any that are kept.
+
+        With allocated_only, chunks holding no entry marked allocated in the
+        $MFT bitmap are skipped without being read. Other records in the
+        chunks that are read are still yielded.
+        """
+        if not self.boot_sector:
+            return
+
+        batch_clusters = max(1, batch_bytes >> self._cluster_shift)
+        runs, mft_size = self._get_mft_layout()
+        total_entries = mft_size // MFT_ENTRY_SIZE
+        bitmap = self._get_mft_bitmap() if allocated_only else None
+
+        pos = 0  # Byte position within the $MFT stream
+        carry = b''  # Partial record left over from the previous chunk
+        for run in runs:
+            if run.cluster is None:  # Sparse, no records there
+                pos += run.length << self._cluster_shift
+                carry = b''
+                continue
+            for first in range(0, run.length, batch_clusters):
+                count = min(batch_clusters, run.length - first)
+                if bitmap is not None:
+                    # Bytes of the bitmap covering every entry in this chunk
+                    size = count << self._cluster_shift
+                    lo = (pos // MFT_ENTRY_SIZE) >> 3
+                    hi = (((pos + size - 1) // MFT_ENTRY_SIZE) >> 3) + 1
+                    if hi <= len(bitmap) and bitmap.count(0, lo, hi) == hi - lo:
+                        pos += size
+                        carry = b''
+                        continue
+                read_result = self.read_clusters_view(run.cluster + first, count)
+                if read_result.is_err():
+                    self.logger.error("Failed to read MFT clusters: %s", read_result.message)
+                    pos += count << self._cluster_shift
+                    carry = b''
+                    continue
+
+                data = carry + read_result.value if carry else read_result.value
+                start = pos - len(carry)
+                pos += count << self._cluster_shift
+
+                # Records start on MFT_ENTRY_SIZE boundaries of the stream
+                view = memoryview(data)
+                offset = -start % MFT_ENTRY_SIZE
+                while offset + MFT_ENTRY_SIZE <= len(view):
+                    entry_number = (start + offset) // MFT_ENTRY_SIZE
+                    if entry_number >= total_entries:
+                        return
+                    yield entry_number, view[offset:offset + MFT_ENTRY_SIZE]
+                    offset += MFT_ENTRY_SIZE
+                carry = bytes(view[offset:])
+
+    def iter_mft_entry_flags(self, allocated_only: bool = False) -> Generator[Tuple[int, int, memoryview], None, None]:
+        """Sequentially scan the MFT, yielding (entry number, flags, raw record)
+
+        Only the record header is parsed, so callers can filter on the flags
+        and fully parse just the entries they need.
+        """
+        for entry_number, record in self.iter_mft_entries(allocated_only=allocated_only):
+            flags = MFTEntry.peek_flags(record)
+            if flags is not None:
+                yield entry_number, flags, record
+
+    def iter_all_files(self) -> Generator[Tuple[str, NTFSFile], None, None]:
+        """Yield (full path, file) for every in-use file in a single MFT scan
+
+        Paths are rebuilt by following $FILE_NAME parent references through
+        a cache filled as the scan goes, instead of walking each directory's
+        index. Parents not seen yet are read directly from the MFT. As in
+        directory listings, the $ system files and everything below them
+        (such as the $Extend files) are left out.
+        """
+        links: Dict[int, Tuple[int, bytes]] = {}  # Entry -> (parent, name)
+        # Resolved directories, root is 5; None for hidden system subtrees
+        dir_paths: Dict[int, Optional[str]] = {5: ''}
+
+        def is_system_file(ref: int, name_utf16: bytes) -> bool:
+            return ref <= LAST_SYSTEM_FILE_REF and name_utf16[:2] == b'$\x00'
+
+        def resolve(ref: int) -> Optional[str]:
+            """Path of an entry, None if unresolvable or under a system file"""
+            chain = []
+            while ref not in dir_paths:
+                link = links.get(ref)
+                if link is None:
+                    entry_result = self.read_mft_entry(ref, use_cache=False)
+                    if entry_result.is_err():
+                        return None
+                    link = _file_name_link(entry_result.value)
+                    if link is None:
+                        return None
+                    links[ref] = link
+                if is_system_file(ref, link[1]):
+                    dir_paths[ref] = None
+                    break
+                chain.append((ref, link[1]))
+                if len(chain) > 1024:  # Parent reference cycle
+                    return None
+                ref = link[0]
+
+            path = dir_paths[ref]
+            if path is None:
+                for ref, _ in chain[1:]:  # Everything above the leaf is hidden too
+                    dir_paths[ref] = None
+                return None
+            for i, (ref, name_utf16) in enumerate(reversed(chain)):
+                path = f"{path}/{_decode_name(name_utf16, 'replace')}"
+                if i < len(chain) - 1:  # Everything above the leaf is a directory
+                    dir_paths[ref] = path
+            return path
+
+        for mft_ref, flags, record in self.iter_mft_entry_flags(allocated_only=True):
+            if not flags & 0x0001 or mft_ref == 5:
+                continue
+            entry_result = MFTEntry.from_bytes(record)
+            if entry_result.is_err():
+                continue
+            entry = entry_result.value
+            entry.reference = mft_ref
+            if entry.base_reference or not entry.has_filename:
+                continue  # Extension records carry no names of their own
+
+            link = _file_name_link(entry)
+            if link is None:
+                continue
+            links[mft_ref] = link
+            if is_system_file(mft_ref, link[1]):
+                dir_paths[mft_ref] = None
+                continue
+
+            path = resolve(mft_ref)
+            if path is None:
+                self.logger.debug("No visible path for MFT entry %d", mft_ref)
+                continue
+            yield path, NTFSFile(entry, self)
+
     def get_file_by_path(self, path: str) -> Result[MFTEntry]:
         """Get MFT entry for a file by its path"""
         if not self.boot_sector:
@@ -292,27 +912,35 @@ class NTFSVolume:
         # Split path into components, handling spaces correctly
         path_parts = [part for part in path.strip('/').split('/') if part]
         
+        children = self._path_trie
         for part in path_parts:
+            # Reuse components resolved by earlier lookups
+            key = part.lower()
+            node = children.get(key)
+            if node is not None:
+                current_entry_num, children = node
+                continue
+
             # Read current directory entry
             dir_result = self.read_mft_entry(current_entry_num)
             if dir_result.is_err():
                 return dir_result
             
             dir_entry = dir_result.value
-            if not dir_entry.is_directory():
+            if not dir_entry.is_dir:
                 return Result.err(
                     NTFSError.NOT_FOUND,
                     f"Path component not a directory: {part}"
                 )
 
-            # List files in current directory
-            files = self._list_directory(dir_entry)
-            
-            # Find matching file/directory
+            # Find matching file/directory in the index, reading only its MFT entry.
+            # NTFS folds case one UTF-16 unit at a time, so only names as long
+            # as the component can match and only those are lowercased.
             found = False
-            for file in files:
-                if file.name.lower() == part.lower():  # Case-insensitive comparison
-                    current_entry_num = file.mft_entry.reference
+            key_length = len(part)
+            for file_ref, filename in self._iter_directory_refs(dir_entry):
+                if len(filename) == key_length and filename.lower() == key:  # Case-insensitive comparison
+                    current_entry_num = file_ref & 0xFFFFFFFFFFFF
                     found = True
                     break
                 
@@ -322,33 +950,40 @@ class NTFSVolume:
                     f"Path component not found: {part}"
                 )
 
+            node = [current_entry_num, {}]
+            children[key] = node
+            children = node[1]
+
         return self.read_mft_entry(current_entry_num)
 
     def close(self):
+        # Cached raw entries may be views of the image mappings
+        with self._cache_lock:
+            pool, self._mft_read_pool = self._mft_read_pool, None
+            self._mft_group_cache.clear()
+        if pool is not None:
+            pool.shutdown()  # Let reads in flight finish before the files close
         if self.split_image:
             self.split_image.close()
         if self.image_file:
             self.image_file.close()
 
-    def _list_directory(self, dir_entry: MFTEntry) -> List[NTFSFile]:
-        """Internal method to list contents of a directory"""
-        files = []
+    def _iter_directory_refs(self, dir_entry: MFTEntry) -> Iterator[Tuple[int, str]]:
+        """Yield (file reference, name) for each entry in a directory's index
+
+        Only the index is parsed; no child MFT entry is read. "." and ".."
+        and the low-numbered $ system files are left out.
+        """
         try:
-            self.logger.debug(f"Listing directory with {len(dir_entry.attributes)} attributes")
-            
-            # Look for $INDEX_ROOT and $INDEX_ALLOCATION attributes
-            index_root = None
-            index_allocation = None
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            self.logger.debug("Listing directory with %d attributes", len(dir_entry.attributes))
             
-            for attr in dir_entry.attributes:
-                self.logger.debug(f"Processing attribute type 0x{attr.type_id:02x}")
-                
-                if attr.type_id == 0x90:  # $INDEX_ROOT
-                    self.logger.debug("Found $INDEX_ROOT attribute")
-                    self._dump_attribute(attr, "  ")
-                    index_root = attr
-                elif attr.type_id == 0xA0:  # $INDEX_ALLOCATION
-                    index_allocation = attr
+            # Look for $INDEX_ROOT and $INDEX_ALLOCATION attributes, the last of each
+            index_root = (dir_entry.attributes_by_type.get(0x90) or [None])[-1]
+            index_allocation = (dir_entry.attributes_by_type.get(0xA0) or [None])[-1]
+            if index_root and debug:
+                self.logger.debug("Found $INDEX_ROOT attribute")
+                self._dump_attribute(index_root, "  ")
             
             # Parse $INDEX_ROOT
             if index_root and index_root.resident:
@@ -358,15 +993,12 @@ class NTFSVolume:
                 # Parse index root header (first 16 bytes)
                 if len(data) < 16:
                     self.logger.debug("$INDEX_ROOT too short")
-                    return files
+                    return
                     
                 # Parse attribute type (should be 0x30 for $FILE_NAME)
-                attr_type = int.from_bytes(data[0:4], 'little')
-                collation_rule = int.from_bytes(data[4:8], 'little')
-                index_size = int.from_bytes(data[8:12], 'little')
-                clusters_per_index = data[12]
+                attr_type, collation_rule, index_size, clusters_per_index = _INDEX_ROOT_HDR.unpack_from(data)
                 
-                self.logger.debug(f"Index root: type=0x{attr_type:x}, collation={collation_rule}, size={index_size}")
+                self.logger.debug("Index root: type=0x%x, collation=%d, size=%d", attr_type, collation_rule, index_size)
                 
                 # Skip index root header (16 bytes) to get to the node header
                 node_header_offset = 16
@@ -374,78 +1006,75 @@ class NTFSVolume:
                 # Parse node header (16 bytes)
                 if len(data) < node_header_offset + 16:
                     self.logger.debug("No space for node header")
-                    return files
+                    return
                     
-                entries_offset = node_header_offset + int.from_bytes(data[node_header_offset:node_header_offset+4], 'little')
-                total_size = int.from_bytes(data[node_header_offset+4:node_header_offset+8], 'little')
-                allocated_size = int.from_bytes(data[node_header_offset+8:node_header_offset+12], 'little')
-                flags = data[node_header_offset+12]
+                entries_offset, total_size, allocated_size, flags = _INDEX_NODE_HDR.unpack_from(data, node_header_offset)
+                entries_offset += node_header_offset
                 
-                self.logger.debug(f"Node header: entries_offset={entries_offset}, size={total_size}, alloc={allocated_size}")
+                self.logger.debug("Node header: entries_offset=%d, size=%d, alloc=%d", entries_offset, total_size, allocated_size)
                 
                 # Start parsing entries from the entries offset
-                offset = entries_offset
-                self.logger.debug(f"Starting to parse entries at offset {offset}")
+                self.logger.debug("Starting to parse entries at offset %d", entries_offset)
                 
-                while offset + 8 <= len(data):  # Need at least 8 bytes for entry header
-                    # Parse entry header
-                    entry_length = int.from_bytes(data[offset:offset+4], 'little')
-                    self.logger.debug(f"Entry at {offset}: length={entry_length}")
-                    
-                    if entry_length == 0:
-                        break
-                        
-                    if offset + entry_length > len(data):
-                        self.logger.debug(f"Entry would exceed data length")
-                        break
-                    
-                    # Get file reference (8 bytes at offset+8)
-                    file_ref = int.from_bytes(data[offset+8:offset+16], 'little')
-                    self.logger.debug(f"File reference: {file_ref}")
-                    
-                    if file_ref != 0:
-                        # Parse filename from the filename attribute in the entry
-                        fn_offset = offset + 16  # Start of filename attribute
-                        
-                        if fn_offset + 66 <= len(data):  # Need space for filename header + 2 bytes
-                            try:
-                                # Get filename length (1 byte)
-                                name_length = data[fn_offset+64]
-                                name_offset = fn_offset + 66
-                                
-                                if name_offset + name_length*2 <= len(data):
-                                    filename = data[name_offset:name_offset+name_length*2].decode('utf-16le')
-                                    self.logger.debug(f"Found filename: {filename}")
-                                    
-                                    if filename not in [".", ".."]:
-                                        if filename not in [".", ".."] and not (filename.startswith("$") and file_ref <= 11):
-                                            # Read the actual MFT entry
-                                            file_entry_result = self.read_mft_entry(file_ref & 0xFFFFFFFFFFFF)
-                                            if file_entry_result.is_ok():
-                                                ntfs_file = NTFSFile(file_entry_result.value, self)
-                                                if ntfs_file.name:
-                                                    self.logger.debug(f"Adding file: {ntfs_file.name}")
-                                                    files.append(ntfs_file)
-                            except Exception as e:
-                                self.logger.error(f"Error parsing filename: {str(e)}")
-                                self.logger.error(traceback.format_exc())
+                entries = _without_system_files(_index_root_entries(data, entries_offset))
+                names = _decode_names([name_utf16 for _, name_utf16 in entries])
+                malformed = names.count(None)
+                if malformed:
+                    self.logger.warning("Skipped %d $INDEX_ROOT entries with malformed names", malformed)
+                for (file_ref, _), filename in zip(entries, names):
+                    if filename is None:
+                        continue
+                    if debug:
+                        self.logger.debug("Found filename: %s", filename)
                     
-                    offset += entry_length
+                    if filename != "." and filename != "..":
+                        yield file_ref, filename
                 
             # Parse $INDEX_ALLOCATION for large directories
             if index_allocation and not index_allocation.resident:
                 self.logger.debug("Found non-resident $INDEX_ALLOCATION - parsing large directory")
-                allocation_files = self._parse_index_allocation(index_allocation)
-                files.extend(allocation_files)
-                self.logger.debug(f"Found {len(allocation_files)} files in $INDEX_ALLOCATION")
+                yield from self._iter_index_allocation(index_allocation)
 
         except Exception as e:
-            self.logger.error(f"Error listing directory: {str(e)}")
-            self.logger.error(f"Stack trace: {traceback.format_exc()}")
-        
-        self.logger.debug(f"Found {len(files)} files in directory")
+            self.logger.error("Error listing directory: %r", e)
+            self.logger.debug("Stack trace:", exc_info=True)
+
+    def _list_directory(self, dir_entry: MFTEntry) -> List[NTFSFile]:
+        """Internal method to list contents of a directory"""
+        files = list(self._iter_directory(dir_entry))
+        self.logger.debug("Found %d files in directory", len(files))
         return files
 
+    def _iter_directory(self, dir_entry: MFTEntry) -> Iterator[NTFSFile]:
+        """Yield an NTFSFile for each named entry of a directory
+
+        Child entries are parsed as they are consumed, so a caller that
+        stops early parses no more of them.
+        """
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        try:
+            # Walk the whole index first so every child entry can be
+            # requested from the OS at once, then read them in order
+            entry_numbers = [file_ref & 0xFFFFFFFFFFFF  # Lower 48 bits of file reference
+                             for file_ref, _ in self._iter_directory_refs(dir_entry)]
+            self.prefetch_mft_entries(entry_numbers)
+            
+            # Bound once rather than looked up for every entry
+            read_mft_entry = self.read_mft_entry
+            for entry_number in entry_numbers:
+                # Read the actual MFT entry
+                file_entry_result = read_mft_entry(entry_number)
+                if file_entry_result.is_ok():
+                    ntfs_file = NTFSFile(file_entry_result.value, self)
+                    if ntfs_file.name:
+                        if debug:
+                            self.logger.debug("Adding file: %s", ntfs_file.name)
+                        yield ntfs_file
+
+        except Exception as e:
+            self.logger.error("Error listing directory: %r", e)
+            self.logger.debug("Stack trace:", exc_info=True)
+
     def list_files(self, path: str = "/") -> Result[List[NTFSFile]]:
         """List all files in a directory"""
         try:
@@ -462,7 +1091,7 @@ class NTFSVolume:
                     return dir_result
                 
                 dir_entry = dir_result.value
-                if not dir_entry.is_directory():
+                if not dir_entry.is_dir:
                     return Result.err(NTFSError.NOT_FOUND, f"Not a directory: {path}")
                 
                 return Result.ok(self._list_directory(dir_entry))
@@ -478,7 +1107,13 @@ class NTFSVolume:
             if file_result.is_err():
                 return file_result
             
-            ntfs_file = NTFSFile(file_result.value, self)
+            return self._write_file(NTFSFile(file_result.value, self), output_path)
+        except Exception as e:
+            return Result.err(NTFSError.IO_ERROR, f"Failed to extract file: {str(e)}")
+
+    def _write_file(self, ntfs_file: NTFSFile, output_path: str) -> Result[None]:
+        """Write the contents of an already resolved file to output_path"""
+        try:
             if ntfs_file.is_directory:
                 return Result.err(NTFSError.INVALID_PARAMETER, "Cannot extract directory")
             
@@ -488,7 +1123,7 @@ class NTFSVolume:
                 return data_result
             
             # Write to output file
-            with open(output_path, 'wb') as f:
+            with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
                 f.write(data_result.value)
             
             return Result.ok(None)
@@ -497,20 +1132,54 @@ class NTFSVolume:
 
     def extract_all_files(self, output_dir: str, path: str = "/") -> Result[None]:
         """Extract all files recursively"""
+        # Bulk extraction streams whole files, switch to sequential readahead
+        if self.split_image:
+            self.split_image.advise(sequential=True)
+        try:
+            return self._extract_all_files(output_dir, path)
+        finally:
+            if self.split_image:
+                self.split_image.advise(sequential=False)
+
+    def _extract_all_files(self, output_dir: str, path: str) -> Result[None]:
+        """Worker for extract_all_files, walking the tree breadth first
+
+        Directories are listed from the entries already read by their parent's
+        listing, and files are written from theirs, so no path is resolved
+        again below the starting directory.
+        """
         try:
-            files_result = self.list_files(path)
-            if files_result.is_err():
-                return files_result
+            dir_result = self.get_file_by_path(path)
+            if dir_result.is_err():
+                return dir_result
+            
+            dir_entry = dir_result.value
+            if not dir_entry.is_dir:
+                return Result.err(NTFSError.NOT_FOUND, f"Not a directory: {path}")
             
             os.makedirs(output_dir, exist_ok=True)
             
-            for file in files_result.value:
-                file_path = os.path.join(output_dir, file.name)
-                if file.is_directory:
-                    os.makedirs(file_path, exist_ok=True)
-                    self.extract_all_files(file_path, os.path.join(path, file.name))
-                else:
-                    self.extract_file(os.path.join(path, file.name), file_path)
+            files = self._iter_directory(dir_entry)
+            pending = deque()  # (output path, MFT entry) of directories to list
+            # Directories already queued, so entries such as "." cannot loop
+            seen = {dir_entry.reference}
+            while True:
+                for file in files:
+                    try:
+                        file_path = os.path.join(output_dir, file.name)
+                        if file.is_directory:
+                            os.makedirs(file_path, exist_ok=True)
+                            if file.mft_entry.reference not in seen:
+                                seen.add(file.mft_entry.reference)
+                                pending.append((file_path, file.mft_entry))
+                        else:
+                            self._write_file(file, file_path)
+                    except Exception as e:
+                        self.logger.error("Failed to extract %s: %s", file.name, e)
+                if not pending:
+                    break
+                output_dir, dir_entry = pending.popleft()
+                files = self._iter_directory(dir_entry)
             
             return Result.ok(None)
         except Exception as e:
@@ -519,41 +1188,74 @@ class NTFSVolume:
     def search_files(self, pattern: str) -> Result[List[str]]:
         """Search for files matching pattern"""
         try:
-            results = []
-            def search_dir(path: str):
-                files_result = self.list_files(path)
-                if files_result.is_err():
-                    return
-                
-                for file in files_result.value:
-                    full_path = os.path.join(path, file.name)
-                    if pattern.lower() in file.name.lower():
-                        results.append(full_path)
-                    if file.is_directory:
-                        search_dir(full_path)
-            
-            search_dir("/")
+            matches = name_matcher(pattern)
+            results = [path for path, file in self.iter_all_files() if matches(file)]
             return Result.ok(results)
         except Exception as e:
             return Result.err(NTFSError.IO_ERROR, f"Failed to search files: {str(e)}")
 
-    def list_deleted_files(self) -> Result[List[NTFSFile]]:
-        """List all deleted files"""
+    def list_deleted_files(self, workers: Optional[int] = None) -> Result[List[NTFSFile]]:
+        """List all deleted files
+
+        On MFTs of PARALLEL_PARSE_MIN_ENTRIES or more, records not in use are
+        parsed in up to workers processes (default one per CPU). Pass
+        workers=1 to always parse in this process.
+        """
         try:
-            deleted_files = []
+            if workers is None:
+                workers = os.cpu_count() or 1
+            _, mft_size = self._get_mft_layout()
+            
+            if workers > 1 and mft_size // MFT_ENTRY_SIZE >= PARALLEL_PARSE_MIN_ENTRIES:
+                try:
+                    summaries = self._parse_deleted_parallel(workers)
+                    return Result.ok([NTFSFile.from_summary(summary, self) for summary in summaries])
+                except (OSError, BrokenProcessPool) as e:
+                    self.logger.warning("Parallel MFT parse failed, parsing in process: %s", e)
             
-            # Scan MFT for deleted entries
-            for mft_ref in range(0, 100000):  # Scan first 100K entries
-                entry_result = self.read_mft_entry(mft_ref)
-                if entry_result.is_ok():
-                    entry = entry_result.value
-                    if not entry.is_in_use() and entry.has_file_name():
-                        deleted_files.append(NTFSFile(entry, self))
+            # Scan MFT for deleted entries, only parsing those not in use
+            entries = [
+                _parse_deleted_record(mft_ref, record)
+                for mft_ref, flags, record in self.iter_mft_entry_flags()
+                if not flags & 0x0001
+            ]
             
-            return Result.ok(deleted_files)
+            return Result.ok([NTFSFile(entry, self) for entry in entries if entry is not None])
         except Exception as e:
             return Result.err(NTFSError.IO_ERROR, f"Failed to list deleted files: {str(e)}")
 
+    def _parse_deleted_parallel(self, workers: int) -> List[_DeletedSummary]:
+        """Scan the MFT headers here and parse records not in use in worker processes
+
+        Batches are collected in MFT order, so the result is in MFT order too.
+        """
+        entries: List[_DeletedSummary] = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            
+            def submit(entry_numbers: List[int], data: bytearray) -> None:
+                pending.append(pool.submit(_parse_deleted_records, entry_numbers, bytes(data)))
+                # Bound the batches held in memory while workers catch up
+                while len(pending) > 2 * workers:
+                    entries.extend(pending.popleft().result())
+            
+            entry_numbers: List[int] = []
+            data = bytearray()
+            for mft_ref, flags, record in self.iter_mft_entry_flags():
+                if flags & 0x0001:
+                    continue
+                entry_numbers.append(mft_ref)
+                data += record
+                if len(entry_numbers) == PARSE_BATCH_ENTRIES:
+                    submit(entry_numbers, data)
+                    entry_numbers, data = [], bytearray()
+            if entry_numbers:
+                submit(entry_numbers, data)
+            
+            while pending:
+                entries.extend(pending.popleft().result())
+        return entries
+
     def get_volume_info(self) -> Result[object]:
         """Get basic volume information"""
         if not self.boot_sector:
@@ -570,105 +1272,71 @@ class NTFSVolume:
 
     def _dump_attribute(self, attr, prefix=""):
         """Debug helper to dump attribute contents"""
-        self.logger.debug(f"{prefix}Attribute type: 0x{attr.type_id:02x}")
-        self.logger.debug(f"{prefix}Resident: {attr.resident}")
+        self.logger.debug("%sAttribute type: 0x%02x", prefix, attr.type_id)
+        self.logger.debug("%sResident: %s", prefix, attr.resident)
         if attr.resident:
-            self.logger.debug(f"{prefix}Data length: {len(attr.data)}")
-            self.logger.debug(f"{prefix}First 32 bytes: {attr.data[:32].hex()}")
+            self.logger.debug("%sData length: %d", prefix, len(attr.data))
+            self.logger.debug("%sFirst 32 bytes: %s", prefix, attr.data[:32].hex())
         else:
-            self.logger.debug(f"{prefix}Non-resident attribute")
+            self.logger.debug("%sNon-resident attribute", prefix)
 
-    def _parse_index_allocation(self, index_allocation: MFTAttribute) -> List[NTFSFile]:
-        """Parse a non-resident $INDEX_ALLOCATION attribute"""
-        files = []
+    def _iter_index_allocation(self, index_allocation: MFTAttribute) -> Iterator[Tuple[int, str]]:
+        """Yield (file reference, name) for each entry of a non-resident $INDEX_ALLOCATION attribute"""
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        malformed = 0
         try:
             if not hasattr(index_allocation, 'data_runs'):
                 self.logger.debug("No data runs in $INDEX_ALLOCATION")
-                return files
+                return
 
+            self.prefetch_runs(index_allocation.data_runs)
             for i, run in enumerate(index_allocation.data_runs):
-                self.logger.debug(f"Processing run {i}: cluster={run.cluster}, length={run.length}")
+                if run.cluster is None:
+                    continue  # Sparse, holds no index blocks
+                if debug:
+                    self.logger.debug("Processing run %d: cluster=%d, length=%d", i, run.cluster, run.length)
                 
-                read_result = self.read_clusters(run.cluster, run.length)
+                # Read into a mutable buffer so the fixup can be applied in place
+                data = bytearray(run.length << self._cluster_shift)
+                with memoryview(data) as view:
+                    read_result = self.readinto_clusters(run.cluster, run.length, view)
                 if read_result.is_err():
-                    self.logger.error(f"Failed to read clusters: {read_result.message}")
+                    self.logger.error("Failed to read clusters: %s", read_result.message)
                     continue
-                    
-                data = read_result.value
+                del data[read_result.value:]
                 
                 # Verify INDX signature
                 if data[0:4] != b'INDX':
-                    self.logger.debug(f"Invalid index block signature: {data[0:4].hex()}")
+                    self.logger.debug("Invalid index block signature: %s", data[0:4].hex())
                     continue
 
-                # Parse index block header
-                usa_offset = int.from_bytes(data[4:6], 'little')
-                usa_count = int.from_bytes(data[6:8], 'little')
+                # Parse index block header and restore the sector tails
+                usa_offset, usa_count = _INDEX_BLOCK_HDR.unpack_from(data)
+                if not _apply_fixup(data, usa_offset, usa_count):
+                    self.logger.error("Index block at cluster %d failed its update sequence check", run.cluster)
+                    continue
                 
                 # Skip to node header
                 node_header_offset = 24
-                entries_offset = node_header_offset + int.from_bytes(data[node_header_offset:node_header_offset+4], 'little')
-                total_size = int.from_bytes(data[node_header_offset+4:node_header_offset+8], 'little')
-                allocated_size = int.from_bytes(data[node_header_offset+8:node_header_offset+12], 'little')
+                entries_offset, total_size, allocated_size, _ = _INDEX_NODE_HDR.unpack_from(data, node_header_offset)
+                entries_offset += node_header_offset
                 
-                self.logger.debug(f"Index block header: entries_offset={entries_offset}, total_size={total_size}, alloc={allocated_size}")
+                self.logger.debug("Index block header: entries_offset=%d, total_size=%d, alloc=%d", entries_offset, total_size, allocated_size)
                 
                 # Parse entries
-                offset = entries_offset
-                while offset + 16 < len(data):  # Need at least entry header
-                    # Parse entry header
-                    file_ref = int.from_bytes(data[offset:offset+8], 'little')  # 8 bytes file reference
-                    entry_length = int.from_bytes(data[offset+8:offset+10], 'little')  # 2 bytes length
-                    key_length = int.from_bytes(data[offset+10:offset+12], 'little')  # 2 bytes key length
-                    flags = data[offset+12]  # 1 byte flags
-                    
-                    self.logger.debug(f"Entry at {offset}: file_ref={file_ref}, length={entry_length}, key_length={key_length}, flags={flags}")
-                    
-                    if flags & 2:  # Last entry
-                        self.logger.debug("Found last entry marker")
-                        break
-                        
-                    if entry_length == 0:  # End marker
-                        break
-
-                    if offset + entry_length > len(data):
-                        self.logger.debug(f"Entry would exceed data length: {offset + entry_length} > {len(data)}")
-                        break
-
-                    # Parse filename attribute (starts after the entry header)
-                    fn_offset = offset + 16  # Skip entry header
-                    
-                    try:
-                        if fn_offset + key_length <= len(data):
-                            # Parse standard filename attribute
-                            name_length = data[fn_offset+64]  # Filename length
-                            namespace = data[fn_offset+65]    # Filename namespace
-                            name_offset = fn_offset + 66      # Filename starts here
-                            
-                            if name_offset + name_length*2 <= len(data):
-                                filename = data[name_offset:name_offset+name_length*2].decode('utf-16le')
-                                self.logger.debug(f"Found file: {filename} (len={name_length}, ns={namespace})")
-                                
-                                # Skip system files (those starting with $ and having low MFT numbers)
-                                if not (filename.startswith("$") and file_ref <= 11):
-                                    # Read the actual MFT entry (lower 48 bits of file reference)
-                                    mft_ref = file_ref & 0xFFFFFFFFFFFF
-                                    file_entry_result = self.read_mft_entry(mft_ref)
-                                    if file_entry_result.is_ok():
-                                        ntfs_file = NTFSFile(file_entry_result.value, self)
-                                        if ntfs_file.name:
-                                            self.logger.debug(f"Adding file: {ntfs_file.name}")
-                                            files.append(ntfs_file)
-                    except Exception as e:
-                        self.logger.error(f"Error parsing filename at offset {fn_offset}: {str(e)}")
-                        self.logger.error(traceback.format_exc())
-                    
-                    offset += entry_length
-
-                self.logger.debug(f"Found {len(files)} files in index block")
+                entries = _without_system_files(_index_block_entries(data, entries_offset))
+                names = _decode_names([name_utf16 for _, name_utf16 in entries])
+                for (file_ref, _), filename in zip(entries, names):
+                    if filename is None:
+                        malformed += 1
+                        continue
+                    if debug:
+                        self.logger.debug("Found file: %s", filename)
+                    yield file_ref, filename
 
         except Exception as e:
-            self.logger.error(f"Error parsing $INDEX_ALLOCATION: {str(e)}")
-            self.logger.error(traceback.format_exc())
-        
-        return files
+            self.logger.error("Error parsing $INDEX_ALLOCATION: %r", e)
+            self.logger.debug("Stack trace:", exc_info=True)
+        finally:
+            if malformed:
+                self.logger.warning("Skipped %d $INDEX_ALLOCATION entries with malformed names", malformed)
@@ -0,0 +1,23 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ntfs.mft import DataRun, MFTAttribute, _decode_data_runs
+
+
+class DecodeDataRunsTest(unittest.TestCase):
+    def test_sparse_runs_are_holes(self):
+        # 1 cluster at 50, 2 sparse, 1 cluster at 50 + 1, end
+        runs = _decode_data_runs(bytes([0x11, 1, 50, 0x01, 2, 0x11, 1, 1, 0]), 0)
+        self.assertEqual(runs, [DataRun(50, 1), DataRun(None, 2), DataRun(51, 1)])
+
+    def test_coalesce_keeps_holes_apart_from_clusters(self):
+        runs = [DataRun(None, 2), DataRun(None, 3), DataRun(9, 1), DataRun(10, 2), DataRun(None, 1)]
+        self.assertEqual(MFTAttribute._coalesce_runs(runs),
+                         [DataRun(None, 5), DataRun(9, 3), DataRun(None, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
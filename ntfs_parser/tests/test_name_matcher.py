@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ntfs.mft import MFTAttribute, MFTEntry
+from src.ntfs.volume import NTFSFile, NTFSVolume, name_matcher
+
+
+def make_file(name_utf16: bytes) -> NTFSFile:
+    """NTFSFile for an MFT entry whose only attribute is a $FILE_NAME with this raw name"""
+    content = bytearray(66) + name_utf16
+    content[64] = len(name_utf16) // 2
+    attr = MFTAttribute(type_id=0x30, name=None, resident=True, data=bytes(content), data_runs=[])
+    entry = MFTEntry(reference=16, sequence=1, base_reference=0, flags=1, used_size=0,
+                     allocated_size=1024, attributes=[attr], attributes_by_type={0x30: [attr]},
+                     in_use=True, has_filename=True)
+    return NTFSFile(entry, NTFSVolume('unused'))
+
+
+class NameMatcherTest(unittest.TestCase):
+    def test_non_ascii_pattern(self):
+        self.assertTrue(name_matcher('ÏN')(make_file('naïne.txt'.encode('utf-16le'))))
+        self.assertFalse(name_matcher('ïn')(make_file('other.txt'.encode('utf-16le'))))
+
+    def test_undecodable_name_does_not_match(self):
+        lone_surrogate = b'a\x00\x00\xd8'
+        with self.assertLogs('NTFSVolume', 'ERROR'):
+            self.assertFalse(name_matcher('ïn')(make_file(lone_surrogate)))
+        self.assertFalse(name_matcher('b')(make_file(lone_surrogate)))
+
+
+if __name__ == '__main__':
+    unittest.main()